@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List
 
+import numpy as np
+
 
 class OptimizationAlgorithm(ABC):
     """
@@ -31,6 +33,29 @@ class OptimizationAlgorithm(ABC):
         """
         pass
 
+    def _evaluate_population(self, population: np.ndarray) -> np.ndarray:
+        """
+        Evaluate every row of ``population``, using the fitness function's
+        batched form (its ``batch`` attribute) when it has one.
+        """
+        batch = getattr(self.fitness_function, 'batch', None)
+        if batch is None:
+            return self._evaluate_each(population)
+
+        fitness_values = np.asarray(batch(population), dtype=float)
+        if fitness_values.shape != (len(population),):
+            raise RuntimeError(
+                f"Batched fitness function returned shape {fitness_values.shape}, "
+                f"expected ({len(population)},)"
+            )
+        if not np.all(np.isfinite(fitness_values)):
+            raise RuntimeError("Batched fitness function returned invalid values")
+        return fitness_values
+
+    def _evaluate_each(self, population: np.ndarray) -> np.ndarray:
+        """Evaluate ``population`` one row at a time via the subclass's ``_evaluate``."""
+        return np.array([self._evaluate(individual) for individual in population])
+
     def get_results(self) -> Dict[str, Any]:
         """
         Return a standard result format so all algorithms are comparable.
@@ -10,6 +10,7 @@ import numpy as np
 import time
 from typing import Any, Dict, List, Tuple
 from .base import OptimizationAlgorithm
+from app.core.utils import evaluate_population
 
 
 class GeneticAlgorithm(OptimizationAlgorithm):
@@ -18,6 +19,10 @@ class GeneticAlgorithm(OptimizationAlgorithm):
     
     Uses real-valued encoding with tournament selection, simulated binary crossover,
     and polynomial mutation for continuous optimization problems.
+
+    Problems with ``encoding='permutation'`` (e.g. TSP) instead evolve integer
+    permutations directly, using ordered crossover and swap mutation. Their
+    best_solution is reported in the random-key form the other algorithms use.
     """
 
     def __init__(self, problem: Dict[str, Any], params: Dict[str, Any]):
@@ -32,6 +37,8 @@ class GeneticAlgorithm(OptimizationAlgorithm):
         self.crossover_rate = params.get('crossover_rate', 0.8)
         self.mutation_rate = params.get('mutation_rate', 0.1)
         self.tournament_size = params.get('tournament_size', 3)
+        # Evaluate individuals concurrently (for expensive fitness functions)
+        self.parallel = bool(params.get('parallel', False))
         
         # Validate GA parameters
         self._validate_parameters()
@@ -41,6 +48,12 @@ class GeneticAlgorithm(OptimizationAlgorithm):
         self.bounds = problem['bounds']
         self.objective = problem.get('objective', 'minimize')
         self.fitness_function = problem['fitness_function']
+        self.encoding = problem.get('encoding', 'real')
+        if self.parallel and not getattr(self.fitness_function, 'thread_safe', True):
+            raise ValueError(
+                "parallel=True requires a thread-safe fitness function; "
+                "this one is marked thread_safe = False"
+            )
         
         # GA state variables
         self.population = None
@@ -142,16 +155,21 @@ class GeneticAlgorithm(OptimizationAlgorithm):
 
     def initialize(self):
         """Initialize population with random individuals."""
-        # Create random population within bounds
-        self.population = np.zeros((self.population_size, self.dimensions))
-        
-        for i in range(self.population_size):
-            for d in range(self.dimensions):
-                lower, upper = self.bounds[d]
-                self.population[i, d] = np.random.uniform(lower, upper)
+        if self.encoding == 'permutation':
+            self.population = np.array([
+                np.random.permutation(self.dimensions) for _ in range(self.population_size)
+            ])
+        else:
+            # Create random population within bounds
+            self.population = np.zeros((self.population_size, self.dimensions))
+            
+            for i in range(self.population_size):
+                for d in range(self.dimensions):
+                    lower, upper = self.bounds[d]
+                    self.population[i, d] = np.random.uniform(lower, upper)
         
         # Evaluate initial population
-        self.fitness_values = np.array([self._evaluate(individual) for individual in self.population])
+        self.fitness_values = self._evaluate_population(self.population)
         
         # Find best individual
         if self.objective == 'minimize':
@@ -161,7 +179,7 @@ class GeneticAlgorithm(OptimizationAlgorithm):
         
         self.best_individual = self.population[best_idx].copy()
         self.best_fitness = self.fitness_values[best_idx]
-        self.best_solution = self.best_individual.tolist()
+        self.best_solution = self._to_solution(self.best_individual)
         
         # Record initial convergence
         self.convergence_curve.append(float(self.best_fitness))
@@ -186,17 +204,26 @@ class GeneticAlgorithm(OptimizationAlgorithm):
                 
                 # Crossover
                 if np.random.random() < self.crossover_rate:
-                    child1, child2 = self._simulated_binary_crossover(parent1, parent2)
+                    if self.encoding == 'permutation':
+                        child1 = self._ordered_crossover(parent1, parent2)
+                        child2 = self._ordered_crossover(parent2, parent1)
+                    else:
+                        child1, child2 = self._simulated_binary_crossover(parent1, parent2)
                 else:
                     child1, child2 = parent1.copy(), parent2.copy()
                 
-                # Mutation
-                child1 = self._polynomial_mutation(child1)
-                child2 = self._polynomial_mutation(child2)
-                
-                # Apply bounds
-                child1 = self._apply_bounds(child1)
-                child2 = self._apply_bounds(child2)
+                if self.encoding == 'permutation':
+                    # Swaps keep each child a valid permutation; no bounds to apply
+                    child1 = self._swap_mutation(child1)
+                    child2 = self._swap_mutation(child2)
+                else:
+                    # Mutation
+                    child1 = self._polynomial_mutation(child1)
+                    child2 = self._polynomial_mutation(child2)
+                    
+                    # Apply bounds
+                    child1 = self._apply_bounds(child1)
+                    child2 = self._apply_bounds(child2)
                 
                 new_population.extend([child1, child2])
             
@@ -205,7 +232,7 @@ class GeneticAlgorithm(OptimizationAlgorithm):
             self.population = np.array(new_population)
             
             # Evaluate new population
-            self.fitness_values = np.array([self._evaluate(individual) for individual in self.population])
+            self.fitness_values = self._evaluate_population(self.population)
             
             # Update best solution
             if self.objective == 'minimize':
@@ -214,14 +241,14 @@ class GeneticAlgorithm(OptimizationAlgorithm):
                 if current_best_fitness < self.best_fitness:
                     self.best_fitness = current_best_fitness
                     self.best_individual = self.population[current_best_idx].copy()
-                    self.best_solution = self.best_individual.tolist()
+                    self.best_solution = self._to_solution(self.best_individual)
             else:
                 current_best_idx = np.argmax(self.fitness_values)
                 current_best_fitness = self.fitness_values[current_best_idx]
                 if current_best_fitness > self.best_fitness:
                     self.best_fitness = current_best_fitness
                     self.best_individual = self.population[current_best_idx].copy()
-                    self.best_solution = self.best_individual.tolist()
+                    self.best_solution = self._to_solution(self.best_individual)
             
             # Record convergence
             self.convergence_curve.append(float(self.best_fitness))
@@ -281,6 +308,41 @@ class GeneticAlgorithm(OptimizationAlgorithm):
         
         return mutated
 
+    def _ordered_crossover(self, parent1: np.ndarray, parent2: np.ndarray) -> np.ndarray:
+        """Ordered crossover (OX): keep a slice of parent1, fill the rest in parent2's order."""
+        start, end = sorted(np.random.choice(self.dimensions + 1, 2, replace=False))
+        segment = parent1[start:end]
+        remaining = parent2[~np.isin(parent2, segment)]
+        
+        child = np.empty_like(parent1)
+        child[:start] = remaining[:start]
+        child[start:end] = segment
+        child[end:] = remaining[start:]
+        return child
+
+    def _swap_mutation(self, individual: np.ndarray) -> np.ndarray:
+        """Swap mutation for permutations."""
+        mutated = individual.copy()
+        
+        for i in range(self.dimensions):
+            if np.random.random() < self.mutation_rate:
+                j = np.random.randint(self.dimensions)
+                mutated[[i, j]] = mutated[[j, i]]
+        
+        return mutated
+
+    def _to_solution(self, individual: np.ndarray) -> List[float]:
+        """
+        Convert an individual to the reported solution vector.
+        Permutations become random keys whose argsort is the permutation,
+        so decoders treat GA results like those of the other algorithms.
+        """
+        if self.encoding != 'permutation':
+            return individual.tolist()
+        keys = np.empty(self.dimensions)
+        keys[individual] = (np.arange(self.dimensions) + 0.5) / self.dimensions
+        return keys.tolist()
+
     def _apply_bounds(self, individual: np.ndarray) -> np.ndarray:
         """Ensure individual stays within bounds."""
         bounded_individual = individual.copy()
@@ -301,6 +363,12 @@ class GeneticAlgorithm(OptimizationAlgorithm):
         except Exception as e:
             raise RuntimeError(f"Error evaluating fitness function for individual {individual}: {str(e)}")
 
+    def _evaluate_each(self, population: np.ndarray) -> np.ndarray:
+        """Evaluate individuals one by one, concurrently when ``parallel`` is set."""
+        if self.parallel:
+            return evaluate_population(self._evaluate, population)
+        return super()._evaluate_each(population)
+
     def get_results(self) -> Dict[str, Any]:
         """
         Return GA results with best_fitness included.
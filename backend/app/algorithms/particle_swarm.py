@@ -161,7 +161,7 @@ class ParticleSwarmOptimization(OptimizationAlgorithm):
 
         # Evaluate initial positions
         self.personal_best_positions = self.positions.copy()
-        self.personal_best_scores = np.array([self._evaluate(p) for p in self.positions])
+        self.personal_best_scores = self._evaluate_population(self.positions)
 
         # Set global best
         if self.objective == 'minimize':
@@ -203,8 +203,9 @@ class ParticleSwarmOptimization(OptimizationAlgorithm):
                 self.positions[i] = self._apply_bounds(self.positions[i])
 
             # Evaluate new positions
+            scores = self._evaluate_population(self.positions)
             for i in range(self.swarm_size):
-                fitness = self._evaluate(self.positions[i])
+                fitness = scores[i]
 
                 # Update personal best
                 if self._is_better(fitness, self.personal_best_scores[i]):
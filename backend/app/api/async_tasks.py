@@ -1,19 +1,36 @@
+import logging
+
+import redis.asyncio as aioredis
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import List, Dict, Any
-from celery import group
-from celery.result import AsyncResult
+from celery import group, states
 
 from ..tasks import run_algorithm
-from ..celery_app import celery
+from ..celery_app import celery, claim_task_id, release_task_id, REDIS_POOL
+
+router = APIRouter(prefix="/async", tags=["async"], default_response_class=ORJSONResponse)
+logger = logging.getLogger(__name__)
+
+# Keys that are always present once a payload has been normalized; a payload
+# carrying all of them can be returned as-is.
+_CANONICAL_KEYS = ("algorithm_display", "iterations_completed", "execution_time", "best_fitness")
+_slow_path_logged = False
 
-router = APIRouter(prefix="/async", tags=["async"])
+# Upper bound on task ids accepted by the bulk status endpoint
+MAX_BULK_TASK_IDS = 100
+
+_redis = aioredis.Redis(connection_pool=REDIS_POOL) if REDIS_POOL else None
 
 class ProblemRequest(BaseModel):
     problem: Dict[str, Any]
     algorithms: List[str]  # e.g. ["genetic", "simulated_annealing"]
     params: Dict[str, Any] = None  # Optional algorithm parameters (shared across algorithms)
 
+class TaskStatusRequest(BaseModel):
+    task_ids: List[str]
+
 def _format_algorithm_field(algo_str: Any) -> Any:
     """
     Normalize the algorithm field into a small structured object when possible.
@@ -30,7 +47,7 @@ def _format_algorithm_field(algo_str: Any) -> Any:
     s = algo_str.strip()
     # parse "MAIN (k=v, ...)" pattern
     if "(" in s and s.endswith(")"):
-        main, rest = s.split("(", 1)
+        main, _, rest = s.partition("(")
         main = main.strip()
         params = rest[:-1].strip()  # drop trailing ')'
         params_dict = {}
@@ -38,8 +55,8 @@ def _format_algorithm_field(algo_str: Any) -> Any:
             part = part.strip()
             if not part:
                 continue
-            if "=" in part:
-                k, v = part.split("=", 1)
+            k, sep, v = part.partition("=")
+            if sep:
                 k = k.strip()
                 v = v.strip()
                 try:
@@ -51,12 +68,11 @@ def _format_algorithm_field(algo_str: Any) -> Any:
             else:
                 params_dict[part] = True
         # try to split main into name / variant like "DE/rand/1/bin"
-        if "/" in main:
-            name, variant = main.split("/", 1)
+        name, sep, variant = main.partition("/")
+        if sep:
             name = name.strip()
             variant = variant.strip()
         else:
-            name = main
             variant = None
         # Preserve variant with slash in the display so DE/rand/1/bin stays readable
         display = f"{name}/{variant}" if variant else f"{name}"
@@ -70,8 +86,8 @@ def _format_algorithm_field(algo_str: Any) -> Any:
         return {"display": display, "name": name, "variant": variant, "details": params_dict, "raw": algo_str}
     
     # fallback: try to split "NAME/variant" without params
-    if "/" in s:
-        name, variant = s.split("/", 1)
+    name, sep, variant = s.partition("/")
+    if sep:
         name = name.strip()
         variant = variant.strip()
         display = f"{name}/{variant}"
@@ -85,22 +101,41 @@ def _normalize_result_payload(res: Any) -> Any:
       - iterations: attempt to infer (params.max_iterations / max_generations / len(convergence_curve))
       - execution_time: pass-through if present
       - best_fitness: try best_fitness OR last value of convergence_curve
-    Mutates and returns a copy-friendly structure.
+
+    Returns the flattened inner dict; ``res`` itself is never modified.
     """
     if not isinstance(res, dict):
         return res
 
     # many tasks return {'algo':..., 'status':..., 'result': {...}}
-    payload = dict(res)  # shallow copy
-    inner = payload.get("result") if isinstance(payload.get("result"), dict) else payload
-    # Ensure inner is a dict to avoid None or non-dict types for static analysis and runtime
-    if inner is None:
-        inner = {}
-    elif not isinstance(inner, dict):
-        try:
-            inner = dict(inner)
-        except Exception:
-            inner = {}
+    inner = res.get("result")
+    if not isinstance(inner, dict):
+        inner = res
+    # Ensure status field exists for ResultsDisplay
+    needs_status = inner is not res and "status" not in inner and "status" in res
+    canonical = all(k in inner for k in _CANONICAL_KEYS)
+
+    # Fast path: worker (or a previous call) already produced the canonical
+    # shape and nothing needs writing
+    if canonical and not needs_status:
+        return inner
+
+    # Payloads come from Celery's cached task meta (shared with other readers
+    # such as the SSE watchers), so copy the one dict we write to rather than
+    # mutating it in place.
+    inner = dict(inner)
+    if needs_status:
+        inner["status"] = res["status"]
+    if canonical:
+        return inner
+
+    global _slow_path_logged
+    if not _slow_path_logged:
+        _slow_path_logged = True
+        logger.info(
+            "Normalizing non-canonical result payload (missing keys: %s)",
+            [k for k in _CANONICAL_KEYS if k not in inner],
+        )
 
     # If algorithm present, normalize it and expose a display string
     algo_val = None
@@ -155,11 +190,6 @@ def _normalize_result_payload(res: Any) -> Any:
                 best = None
     inner["best_fitness"] = best
 
-    # Ensure status field exists for ResultsDisplay
-    if "status" not in inner and "status" in payload:
-        inner["status"] = payload.get("status")
-
-    # place normalized inner back into payload in same shape
     # Return the flattened inner dict that frontend `ResultsDisplay` expects
     return inner
 
@@ -181,12 +211,30 @@ def optimize(problem_req: ProblemRequest):
 
     # Create a group of signatures using the registered Celery task helper
     # Pass params to each algorithm task (params are shared across all algorithms in async mode)
+    # Algorithms already submitted with an identical payload reuse that task id
+    # instead of being queued again.
     algo_params = problem_req.params or {}
-    sigs = [run_algorithm.s(algo, problem_payload, algo_params) for algo in problem_req.algorithms]
-    job = group(sigs)
+    task_ids = []
+    claimed = []
     try:
-        group_result = job.apply_async()
+        sigs = []
+        for algo in problem_req.algorithms:
+            task_id, is_new = claim_task_id(algo, problem_payload, algo_params)
+            task_ids.append(task_id)
+            if is_new:
+                claimed.append((task_id, algo))
+                sigs.append(
+                    run_algorithm.s(algo, problem_payload, algo_params).set(task_id=task_id)
+                )
+        group_result = group(sigs).apply_async() if sigs else None
     except Exception as exc:
+        # Nothing was queued under the ids claimed above — release them so
+        # identical resubmissions do not wait on tasks that will never run.
+        for task_id, algo in claimed:
+            try:
+                release_task_id(task_id, algo, problem_payload, algo_params)
+            except Exception:
+                logger.warning("Could not release dedupe key for task %s", task_id)
         raise HTTPException(
             status_code=503,
             detail={
@@ -197,17 +245,15 @@ def optimize(problem_req: ProblemRequest):
                 ),
             },
         )
-    child_ids = [res.id for res in group_result.results]
 
-    return {"group_id": group_result.id, "task_ids": child_ids}
+    return {"group_id": group_result.id if group_result else None, "task_ids": task_ids}
 
-@router.get("/tasks/{task_id}")
-def get_task_status(task_id: str):
-    async_res = AsyncResult(task_id, app=celery)
-    state = async_res.state
+def _task_status_response(task_id: str, meta: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the status response for one task from its decoded backend meta."""
+    state = meta.get("status", states.PENDING)
     response = {"task_id": task_id, "state": state}
-    if async_res.ready():
-        res = async_res.result
+    if state == states.SUCCESS:
+        res = meta.get("result")
         # Normalize the payload (algorithm display, iterations, execution_time, etc.)
         try:
             if isinstance(res, dict):
@@ -216,6 +262,56 @@ def get_task_status(task_id: str):
             # Fall back to the raw result if normalization fails
             pass
         response["result"] = res
-    elif state == "FAILURE":
-        response["result"] = async_res.info  # Error details
-    return response
\ No newline at end of file
+    elif state in states.READY_STATES:
+        # FAILURE / REVOKED: the backend has already rebuilt the exception
+        response["result"] = str(meta.get("result"))  # Error details
+    return response
+
+async def get_many_task_metas(task_ids: List[str]) -> List[Dict[str, Any]]:
+    """
+    Fetch the backend meta for many tasks in a single pipelined round trip.
+    Tasks without a stored result are reported as PENDING.
+    """
+    async with _redis.pipeline(transaction=False) as pipe:
+        for task_id in task_ids:
+            pipe.get(celery.backend.get_key_for_task(task_id))
+        raws = await pipe.execute()
+    return [
+        celery.backend.decode_result(raw) if raw is not None else {"status": states.PENDING}
+        for raw in raws
+    ]
+
+@router.get("/tasks/{task_id}")
+def get_task_status(task_id: str):
+    # Read the stored meta once; AsyncResult re-fetches it from Redis for every
+    # property access (state, result, info) until the task is ready.
+    meta = celery.backend.get_task_meta(task_id)
+    # Results come straight from the JSON result backend (errors are already
+    # strings), so orjson can encode them directly without FastAPI's
+    # jsonable_encoder walking every float in the convergence curve first.
+    return ORJSONResponse(content=_task_status_response(task_id, meta))
+
+@router.post("/tasks/status")
+async def get_tasks_status(status_req: TaskStatusRequest):
+    """
+    Bulk variant of GET /tasks/{task_id} for dashboards tracking many tasks.
+    Returns one status object per requested id, in request order.
+    """
+    if len(status_req.task_ids) > MAX_BULK_TASK_IDS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {MAX_BULK_TASK_IDS} task ids can be queried at once",
+        )
+    if _redis is None:
+        raise HTTPException(
+            status_code=503,
+            detail={
+                "error": "Task queue unavailable",
+                "message": "Task status is unavailable — no result backend (REDIS_URL) is configured.",
+            },
+        )
+    metas = await get_many_task_metas(status_req.task_ids)
+    return ORJSONResponse(content=[
+        _task_status_response(task_id, meta)
+        for task_id, meta in zip(status_req.task_ids, metas)
+    ])
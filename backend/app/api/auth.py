@@ -1,6 +1,8 @@
 """
 Authentication endpoints for OptimizeHub.
 """
+import asyncio
+
 from fastapi import APIRouter, HTTPException, status, Depends
 from pydantic import BaseModel, EmailStr
 from typing import Optional
@@ -39,7 +41,7 @@ async def signup(request: SignupRequest):
         supabase = get_supabase_public()
         
         # Create auth user
-        res = supabase.auth.sign_up({
+        res = await asyncio.to_thread(supabase.auth.sign_up, {
             "email": request.email,
             "password": request.password,
             "options": {
@@ -57,7 +59,7 @@ async def signup(request: SignupRequest):
             }
             
             try:
-                supabase_admin.table("profiles").insert(profile_data).execute()
+                await asyncio.to_thread(supabase_admin.table("profiles").insert(profile_data).execute)
             except Exception as e:
                 # If profile creation fails, user is still created in auth
                 # Log the error but don't fail the signup
@@ -106,7 +108,7 @@ async def login(request: LoginRequest):
     try:
         supabase = get_supabase_public()
         
-        res = supabase.auth.sign_in_with_password({
+        res = await asyncio.to_thread(supabase.auth.sign_in_with_password, {
             "email": request.email,
             "password": request.password
         })
@@ -115,7 +117,9 @@ async def login(request: LoginRequest):
             # Get username from profile
             username = None
             try:
-                profile = supabase.table("profiles").select("username").eq("id", res.user.id).execute()
+                profile = await asyncio.to_thread(
+                    supabase.table("profiles").select("username").eq("id", res.user.id).execute
+                )
                 if profile.data and len(profile.data) > 0:
                     username = profile.data[0].get("username")
             except Exception:
@@ -181,8 +185,8 @@ async def get_current_user(credentials:HTTPAuthorizationCredentials = Depends(se
     
     try:
         supabase = get_supabase_public()
-        # Verify the JWT token with Supabase
-        user = supabase.auth.get_user(token)
+        # Verify the JWT token with Supabase (blocking HTTP call, so off the event loop)
+        user = await asyncio.to_thread(supabase.auth.get_user, token)
         
         if not user or not user.user.id:
             raise HTTPException(
@@ -2,6 +2,7 @@
 API endpoints for user persistence features.
 Requires authentication for all endpoints.
 """
+import asyncio
 from typing import List, Optional, Dict
 from fastapi import APIRouter, HTTPException, status, Depends
 from typing import List, Optional
@@ -41,7 +42,7 @@ async def save_run(
         Saved run with ID and timestamp
     """
     try:
-        return service.save_optimization_run(user_id, run_data)
+        return await asyncio.to_thread(service.save_optimization_run, user_id, run_data)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -68,7 +69,7 @@ async def get_run_history(
     Returns:
         List of user's optimization runs
     """
-    return service.get_user_run_history(user_id, limit, offset)
+    return await asyncio.to_thread(service.get_user_run_history, user_id, limit, offset)
 
 
 @router.get("/runs/public", response_model=List[OptimizationRunResponse])
@@ -88,7 +89,7 @@ async def get_public_runs(
     Returns:
         List of public runs
     """
-    return service.get_public_runs(algorithm, limit)
+    return await asyncio.to_thread(service.get_public_runs, algorithm, limit)
 
 
 @router.get("/runs/{run_id}", response_model=OptimizationRunResponse)
@@ -108,7 +109,7 @@ async def get_run(
     Returns:
         Run details
     """
-    run = service.get_run_by_id(run_id, user_id)
+    run = await asyncio.to_thread(service.get_run_by_id, run_id, user_id)
     if not run:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -135,7 +136,7 @@ async def share_run(
         Confirmation message
     """
     try:
-        service.share_run(run_id, user_id, shared_by)
+        await asyncio.to_thread(service.share_run, run_id, user_id, shared_by)
         return {
             "message": "Run shared successfully",
             "run_id": run_id
@@ -172,7 +173,7 @@ async def save_configuration(
         Saved configuration with ID
     """
     try:
-        return service.save_configuration(user_id, config_data)
+        return await asyncio.to_thread(service.save_configuration, user_id, config_data)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -195,7 +196,7 @@ async def get_my_configurations(
     Returns:
         List of user's configurations
     """
-    return service.get_user_configurations(user_id, limit)
+    return await asyncio.to_thread(service.get_user_configurations, user_id, limit)
 
 
 @router.get("/configs/public", response_model=List[SavedConfigurationResponse])
@@ -215,7 +216,7 @@ async def get_public_configurations(
     Returns:
         List of public configurations
     """
-    return service.get_public_configurations(algorithm, tags, limit)
+    return await asyncio.to_thread(service.get_public_configurations, algorithm, tags, limit)
 
 
 @router.delete("/configs/{config_id}")
@@ -234,7 +235,7 @@ async def delete_configuration(
         Confirmation message
     """
     try:
-        service.delete_configuration(config_id, user_id)
+        await asyncio.to_thread(service.delete_configuration, config_id, user_id)
         return {"message": "Configuration deleted successfully"}
     except PermissionError as e:
         raise HTTPException(
@@ -265,4 +266,4 @@ async def get_user_stats(
     Returns:
         User statistics (total runs, favorite algorithm, etc.)
     """
-    return service.get_user_stats(user_id)
\ No newline at end of file
+    return await asyncio.to_thread(service.get_user_stats, user_id)
\ No newline at end of file
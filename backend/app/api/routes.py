@@ -2,13 +2,15 @@
 FastAPI routes for OptimizeHub API.
 Includes user persistence for saving optimization runs and configurations.
 """
-from fastapi import APIRouter, HTTPException, status, UploadFile, File, Depends
+from fastapi import APIRouter, HTTPException, status, UploadFile, File, Depends, Request, Response
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from typing import Dict, Any, Optional
 import asyncio
+import hashlib
 import threading
 import yaml
 import logging
+import orjson
 from app.models.problem import OptimizationRequest, ProblemInput
 from app.models.result import (
     OptimizationResult,
@@ -42,9 +44,6 @@ except ImportError:
 # Initialize router
 router = APIRouter()
 
-# Initialize executor
-executor = AlgorithmExecutor()
-
 # Initialize persistence service (if available)
 persistence_service = None
 if PERSISTENCE_AVAILABLE:
@@ -56,6 +55,9 @@ logger = logging.getLogger(__name__)
 # Security scheme for optional authentication
 security = HTTPBearer(auto_error=False)
 
+# Registry only changes on deploy; clients revalidate with the ETag after this.
+ALGORITHM_LIST_CACHE_CONTROL = "public, max-age=3600"
+
 
 # ==============================================================================
 # HELPER: Extract and verify user from JWT token
@@ -76,7 +78,7 @@ async def get_current_user_optional(
     try:
         token = credentials.credentials
         supabase = get_supabase_public()
-        user = supabase.auth.get_user(token)
+        user = await asyncio.to_thread(supabase.auth.get_user, token)
         
         if user and user.user.id:
             return user.user.id
@@ -86,6 +88,14 @@ async def get_current_user_optional(
         return None
 
 
+def get_executor(request: Request) -> AlgorithmExecutor:
+    """
+    Executor dependency.
+    Returns the process-wide AlgorithmExecutor created in the app lifespan.
+    """
+    return request.app.state.executor
+
+
 # ==============================================================================
 # OPTIMIZATION ENDPOINTS
 # ==============================================================================
@@ -93,7 +103,8 @@ async def get_current_user_optional(
 @router.post("/optimize", response_model=OptimizationResult, status_code=status.HTTP_200_OK)
 async def run_optimization(
     request: OptimizationRequest,
-    user_id: Optional[str] = Depends(get_current_user_optional)
+    user_id: Optional[str] = Depends(get_current_user_optional),
+    executor: AlgorithmExecutor = Depends(get_executor)
 ) -> OptimizationResult:
     """
     Run an optimization algorithm on a given problem.
@@ -106,6 +117,7 @@ async def run_optimization(
     Args:
         request: Optimization request with algorithm, problem, and parameters
         user_id: Optional current authenticated user (from JWT token)
+        executor: Shared algorithm executor (injected)
 
     Returns:
         Optimization results with status, solution, and convergence data
@@ -206,10 +218,12 @@ async def run_optimization(
             )
             
             # Save the run to database
-            saved_run = persistence_service.save_optimization_run(user_id, run_to_save)
+            saved_run = await asyncio.to_thread(
+                persistence_service.save_optimization_run, user_id, run_to_save
+            )
             
             # Update user statistics
-            persistence_service.update_user_stats(user_id, request.algorithm)
+            await asyncio.to_thread(persistence_service.update_user_stats, user_id, request.algorithm)
             
             # Add run ID to response for frontend reference
             result["run_id"] = str(saved_run.id)
@@ -225,6 +239,14 @@ async def run_optimization(
     return OptimizationResult(**result)
 
 
+def _parse_yaml_config(config_content: str):
+    """Parse YAML config, returning (config, error) instead of raising."""
+    try:
+        return yaml.safe_load(config_content), None
+    except yaml.YAMLError as e:
+        return None, e
+
+
 @router.post("/optimize/custom", response_model=OptimizationResult, status_code=status.HTTP_200_OK)
 async def run_optimization_custom(
     fitness_file: UploadFile = File(..., description="Python file containing fitness function"),
@@ -266,8 +288,12 @@ async def run_optimization_custom(
 
     # Read files
     try:
-        fitness_code = (await fitness_file.read()).decode('utf-8')
-        config_content = (await config_file.read()).decode('utf-8')
+        fitness_bytes, config_bytes = await asyncio.gather(
+            fitness_file.read(),
+            config_file.read()
+        )
+        fitness_code = fitness_bytes.decode('utf-8')
+        config_content = config_bytes.decode('utf-8')
     except UnicodeDecodeError:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -287,8 +313,13 @@ async def run_optimization_custom(
             detail="Config file too large (max 1MB)"
         )
 
-    # Validate fitness function code
-    is_valid, error_message = validate_fitness_code(fitness_code)
+    # Validate fitness function code and parse YAML configuration concurrently;
+    # both are CPU-bound and independent, so run them off the event loop
+    (is_valid, error_message), (config, yaml_error) = await asyncio.gather(
+        asyncio.to_thread(validate_fitness_code, fitness_code),
+        asyncio.to_thread(_parse_yaml_config, config_content)
+    )
+
     if not is_valid:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -298,13 +329,10 @@ async def run_optimization_custom(
             }
         )
 
-    # Parse YAML configuration
-    try:
-        config = yaml.safe_load(config_content)
-    except yaml.YAMLError as e:
+    if yaml_error is not None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid YAML configuration: {str(e)}"
+            detail=f"Invalid YAML configuration: {str(yaml_error)}"
         )
 
     # Validate configuration structure
@@ -333,7 +361,8 @@ async def run_optimization_custom(
     # Execute in Modal sandbox
     try:
         docker_executor = get_docker_executor()
-        result = docker_executor.execute_custom_fitness(fitness_code, config)
+        # Blocks on the Modal call for the whole run, so keep it off the event loop
+        result = await asyncio.to_thread(docker_executor.execute_custom_fitness, fitness_code, config)
 
         # Check if execution was successful
         if not result.get('success', False):
@@ -389,8 +418,10 @@ async def run_optimization_custom(
                     fitness_function_name="Custom"
                 )
                 
-                saved_run = persistence_service.save_optimization_run(user_id, run_to_save)
-                persistence_service.update_user_stats(user_id, config['algorithm'])
+                saved_run = await asyncio.to_thread(
+                    persistence_service.save_optimization_run, user_id, run_to_save
+                )
+                await asyncio.to_thread(persistence_service.update_user_stats, user_id, config['algorithm'])
                 
                 # Convert response to dict to add run_id
                 result_dict = optimization_result.model_dump()
@@ -427,7 +458,7 @@ async def run_optimization_custom(
 # ==============================================================================
 
 @router.get("/algorithms", response_model=AlgorithmListResponse)
-async def list_algorithms() -> AlgorithmListResponse:
+async def list_algorithms(request: Request) -> Response:
     """
     Get list of all algorithms with their status and details.
 
@@ -435,15 +466,46 @@ async def list_algorithms() -> AlgorithmListResponse:
     - Available algorithms (ready to use)
     - Coming soon algorithms (in development)
 
+    The registry is static, so the response body is validated and encoded
+    once at startup (see ``build_algorithm_list_body``) and served as-is,
+    with an ETag so repeat clients get a 304 instead of the full body.
+
     Returns:
         List of algorithms with metadata
     """
-    algorithm_list = executor.get_algorithm_list()
-    return AlgorithmListResponse(**algorithm_list)
+    etag = request.app.state.algorithm_list_etag
+    headers = {"ETag": etag, "Cache-Control": ALGORITHM_LIST_CACHE_CONTROL}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (
+        if_none_match.strip() == "*"
+        or etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    ):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(
+        content=request.app.state.algorithm_list_body,
+        media_type="application/json",
+        headers=headers,
+    )
+
+
+def build_algorithm_list_body(executor: AlgorithmExecutor) -> bytes:
+    """Validate and JSON-encode the algorithm list served by GET /algorithms."""
+    algorithm_list = AlgorithmListResponse(**executor.get_algorithm_list())
+    return orjson.dumps(algorithm_list.model_dump(mode="json"))
+
+
+def build_algorithm_list_etag(body: bytes) -> str:
+    """Strong ETag for the encoded algorithm list."""
+    return f'"{hashlib.sha256(body).hexdigest()}"'
 
 
 @router.get("/algorithms/{algorithm_name}", response_model=AlgorithmInfo)
-async def get_algorithm_info(algorithm_name: str) -> AlgorithmInfo:
+async def get_algorithm_info(
+    algorithm_name: str,
+    executor: AlgorithmExecutor = Depends(get_executor)
+) -> AlgorithmInfo:
     """
     Get detailed information about a specific algorithm.
 
@@ -586,25 +648,28 @@ async def health_check() -> HealthResponse:
 # ROOT ENDPOINT (unchanged)
 # ==============================================================================
 
+_API_ROOT_BODY = orjson.dumps({
+    "message": "Welcome to OptimizeHub API",
+    "version": "1.0.0",
+    "docs_url": "/docs",
+    "health_check_url": "/api/health",
+    "endpoints": {
+        "POST /api/optimize": "Run optimization algorithm",
+        "POST /api/optimize/custom": "Run optimization with custom fitness function (Modal sandbox)",
+        "GET /api/algorithms": "List all algorithms",
+        "GET /api/algorithms/{name}": "Get algorithm details",
+        "POST /api/validate": "Validate problem definition",
+        "GET /api/health": "Health check"
+    }
+})
+
+
 @router.get("/")
-async def root() -> Dict[str, Any]:
+async def root() -> Response:
     """
     API root endpoint.
 
     Returns:
-        Welcome message and API information
+        Welcome message and API information (pre-encoded at import)
     """
-    return {
-        "message": "Welcome to OptimizeHub API",
-        "version": "1.0.0",
-        "docs_url": "/docs",
-        "health_check_url": "/api/health",
-        "endpoints": {
-            "POST /api/optimize": "Run optimization algorithm",
-            "POST /api/optimize/custom": "Run optimization with custom fitness function (Modal sandbox)",
-            "GET /api/algorithms": "List all algorithms",
-            "GET /api/algorithms/{name}": "Get algorithm details",
-            "POST /api/validate": "Validate problem definition",
-            "GET /api/health": "Health check"
-        }
-    }
\ No newline at end of file
+    return Response(content=_API_ROOT_BODY, media_type="application/json")
@@ -2,27 +2,185 @@
 Server-Sent Events (SSE) endpoint for real-time task status updates.
 
 Provides streaming updates for Celery task status without polling.
+The Redis result backend PUBLISHes every state change on a channel named
+after the task's result key. A single process-wide listener
+(``run_result_listener``, started in the app lifespan) pattern-subscribes
+to all of those channels and hands each update to the per-task watcher,
+which fans it out to every stream open on that task.
 """
 from fastapi import APIRouter
 from fastapi.responses import StreamingResponse
-from celery.result import AsyncResult
-import json
+import redis.asyncio as aioredis
+import orjson
 import asyncio
 import logging
+from typing import Any, Dict, Optional
 
-from ..celery_app import celery
+from ..celery_app import celery, REDIS_POOL
+from ..config import SSE_KEEPALIVE_INTERVAL, SSE_MAX_LIFETIME
 from .async_tasks import _normalize_result_payload
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Shares the process-wide pool; the result listener holds one connection
+# from it for its pub/sub subscription.
+_redis = aioredis.Redis(connection_pool=REDIS_POOL) if REDIS_POOL else None
+
+_TERMINAL_STATES = ("SUCCESS", "FAILURE")
+
+# Delay before the result listener re-subscribes after losing its connection
+_LISTENER_RETRY_DELAY = 1.0
+
+
+class _TaskWatcher:
+    """
+    Latest backend state for one task, shared by all of its streams.
+
+    ``meta`` holds the latest decoded Celery meta. ``changed`` is set (and
+    replaced with a fresh event) whenever ``meta`` or ``error`` is updated.
+    The SSE frame for the current meta is encoded once and reused by every
+    stream on the task.
+    """
+
+    def __init__(self, task_id: str):
+        self.task_id = task_id
+        self.meta: Optional[Dict[str, Any]] = None
+        self._frame: Optional[bytes] = None
+        self.error: Optional[Exception] = None
+        self.changed = asyncio.Event()
+        self.refcount = 0
+        self._task = asyncio.create_task(self.refresh())
+
+    def _notify(self) -> None:
+        changed, self.changed = self.changed, asyncio.Event()
+        changed.set()
+
+    def _set_meta(self, meta: Dict[str, Any]) -> None:
+        self.meta = meta
+        self._frame = None
+        self._notify()
+
+    def frame(self) -> bytes:
+        """SSE frame for the current meta."""
+        if self._frame is None:
+            self._frame = _format_frame(**_status_data(self.task_id, self.meta))
+        return self._frame
+
+    async def refresh(self) -> None:
+        """Read the stored meta; later changes arrive via the result listener."""
+        try:
+            raw = await _redis.get(celery.backend.get_key_for_task(self.task_id))
+        except Exception as e:
+            logger.error(f"Watcher for task {self.task_id} failed: {str(e)}", exc_info=True)
+            self.error = e
+            self._notify()
+            return
+        # A published final state may have landed while the GET was in flight;
+        # never replace it with an older stored value.
+        if self.meta is not None and self.meta.get("status") in _TERMINAL_STATES:
+            return
+        self._set_meta(celery.backend.decode_result(raw) if raw is not None else {"status": "PENDING"})
+
+    def close(self) -> None:
+        self._task.cancel()
+
+
+_watchers: Dict[str, _TaskWatcher] = {}
+
+
+async def run_result_listener() -> None:
+    """
+    Forward result-backend state publications to the watchers of their tasks.
+
+    Runs for the lifetime of the app with one pattern subscription, so open
+    streams cost no Redis connections of their own. After a dropped
+    connection it re-subscribes and re-reads the state of every watched
+    task, since updates published in between were missed.
+    """
+    prefix = celery.backend.task_keyprefix
+    if isinstance(prefix, bytes):
+        prefix = prefix.decode()
+
+    while True:
+        pubsub = _redis.pubsub()
+        try:
+            await pubsub.psubscribe(prefix + "*")
+            for watcher in list(_watchers.values()):
+                await watcher.refresh()
+
+            async for message in pubsub.listen():
+                if message["type"] != "pmessage":
+                    continue
+                watcher = _watchers.get(message["channel"][len(prefix):])
+                if watcher is not None:
+                    watcher._set_meta(celery.backend.decode_result(message["data"]))
+
+        except asyncio.CancelledError:
+            raise
+
+        except Exception as e:
+            logger.error(f"Result listener disconnected: {str(e)}", exc_info=True)
+            await asyncio.sleep(_LISTENER_RETRY_DELAY)
+
+        finally:
+            await pubsub.aclose()
+
+
+def _acquire_watcher(task_id: str) -> _TaskWatcher:
+    watcher = _watchers.get(task_id)
+    if watcher is None or watcher.error is not None:
+        watcher = _watchers[task_id] = _TaskWatcher(task_id)
+    watcher.refcount += 1
+    return watcher
+
+
+def _release_watcher(watcher: _TaskWatcher) -> None:
+    watcher.refcount -= 1
+    if watcher.refcount == 0:
+        watcher.close()
+        if _watchers.get(watcher.task_id) is watcher:
+            del _watchers[watcher.task_id]
+
+
+def _format_frame(task_id: str, state: str, result: Any = None, error: Optional[str] = None) -> bytes:
+    """Encode one SSE ``data:`` event for the given task state."""
+    return b"data: " + orjson.dumps(
+        {"task_id": task_id, "state": state, "result": result, "error": error}
+    ) + b"\n\n"
+
+
+def _status_data(task_id: str, meta: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the SSE payload for a decoded Celery result meta."""
+    state = meta.get("status", "PENDING")
+    status_data = {
+        "task_id": task_id,
+        "state": state,
+        "result": None,
+        "error": None
+    }
+    if state == "SUCCESS":
+        # Normalize the stored Celery result so SSE messages match GET /async/tasks shape
+        result = meta.get("result")
+        try:
+            status_data["result"] = _normalize_result_payload(result) if result is not None else None
+        except Exception:
+            status_data["result"] = result
+    elif state == "FAILURE":
+        error = meta.get("result")
+        status_data["error"] = str(error) if error else "Unknown error"
+    return status_data
+
 
 @router.get("/async/tasks/{task_id}/stream")
 async def stream_task_status(task_id: str):
     """
     Stream task status updates via Server-Sent Events.
 
-    Client receives updates every 1 second until task completes (SUCCESS or FAILURE).
+    Client receives an update on connect and on every task state change
+    until the task completes (SUCCESS or FAILURE). While the task is idle a
+    keepalive comment is sent every SSE_KEEPALIVE_INTERVAL seconds, and the
+    stream ends with an ERROR event after SSE_MAX_LIFETIME seconds.
 
     Args:
         task_id: Celery task ID to monitor
@@ -47,48 +205,54 @@ async def stream_task_status(task_id: str):
         """
         logger.info(f"Starting SSE stream for task: {task_id}")
 
+        watcher = _acquire_watcher(task_id)
+
         try:
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + SSE_MAX_LIFETIME
+            last_meta = None
+
             while True:
-                # Get task status from Celery
-                async_result = AsyncResult(task_id, app=celery)
-
-                status_data = {
-                    "task_id": task_id,
-                    "state": async_result.state,
-                    "result": None,
-                    "error": None
-                }
-
-                # Handle different task states
-                if async_result.state == "SUCCESS":
-                    # Normalize the stored Celery result so SSE messages match GET /async/tasks shape
-                    try:
-                        status_data["result"] = _normalize_result_payload(async_result.result) if async_result.result is not None else None
-                    except Exception:
-                        status_data["result"] = async_result.result
-                    logger.info(f"Task {task_id} completed successfully")
-                    yield f"data: {json.dumps(status_data)}\n\n"
-                    break  # Stop streaming on success
-
-                elif async_result.state == "FAILURE":
-                    # Get error information
-                    error_info = str(async_result.info) if async_result.info else "Unknown error"
-                    status_data["error"] = error_info
-                    logger.warning(f"Task {task_id} failed: {error_info}")
-                    yield f"data: {json.dumps(status_data)}\n\n"
-                    break  # Stop streaming on failure
-
-                elif async_result.state in ["PENDING", "STARTED"]:
-                    # Task is still running - send update
-                    yield f"data: {json.dumps(status_data)}\n\n"
-
-                else:
-                    # Unknown state - send update
-                    logger.debug(f"Task {task_id} in state: {async_result.state}")
-                    yield f"data: {json.dumps(status_data)}\n\n"
-
-                # Wait 1 second before next update
-                await asyncio.sleep(1)
+                changed = watcher.changed
+                if watcher.error is not None:
+                    raise watcher.error
+
+                meta = watcher.meta
+                if meta is not None and meta is not last_meta:
+                    last_meta = meta
+                    state = meta.get("status", "PENDING")
+                    yield watcher.frame()
+
+                    # Handle different task states
+                    if state == "SUCCESS":
+                        logger.info(f"Task {task_id} completed successfully")
+                        break  # Stop streaming on success
+
+                    elif state == "FAILURE":
+                        logger.warning(f"Task {task_id} failed: {meta.get('result')}")
+                        break  # Stop streaming on failure
+
+                    elif state not in ("PENDING", "STARTED"):
+                        # Unknown state - update already sent
+                        logger.debug(f"Task {task_id} in state: {state}")
+
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    logger.warning(f"SSE stream for task {task_id} exceeded {SSE_MAX_LIFETIME}s")
+                    yield _format_frame(
+                        task_id, "ERROR",
+                        error=f"Stream timed out after {SSE_MAX_LIFETIME}s; check the task status again later",
+                    )
+                    break
+
+                # Wait for the watcher to report the next state change,
+                # pinging while idle so proxies don't drop the connection
+                try:
+                    await asyncio.wait_for(
+                        changed.wait(), timeout=min(SSE_KEEPALIVE_INTERVAL, remaining)
+                    )
+                except asyncio.TimeoutError:
+                    yield b": keepalive\n\n"
 
         except asyncio.CancelledError:
             # Client disconnected
@@ -97,13 +261,10 @@ async def stream_task_status(task_id: str):
         except Exception as e:
             # Unexpected error
             logger.error(f"Error in SSE stream for task {task_id}: {str(e)}", exc_info=True)
-            error_data = {
-                "task_id": task_id,
-                "state": "ERROR",
-                "result": None,
-                "error": f"Stream error: {str(e)}"
-            }
-            yield f"data: {json.dumps(error_data)}\n\n"
+            yield _format_frame(task_id, "ERROR", error=f"Stream error: {str(e)}")
+
+        finally:
+            _release_watcher(watcher)
 
     return StreamingResponse(
         event_stream(),
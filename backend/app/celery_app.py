@@ -1,7 +1,11 @@
 from celery import Celery
+import redis.asyncio as aioredis
+import hashlib
+import orjson
 import os
 import ssl as _ssl
 import logging
+from uuid import uuid4
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +21,9 @@ if not REDIS_URL:
 else:
     logger.info(f"✓ Celery broker URL configured: {REDIS_URL.split('@')[0]}@...{REDIS_URL[-20:]}")
 
+# Stored task results (and the dedupe keys pointing at them) expire after this.
+RESULT_TTL = 3600
+
 celery = Celery(
     "optimizehub",
     broker_url=REDIS_URL,
@@ -32,7 +39,15 @@ celery.conf.update(
     enable_utc=True,
     timezone="UTC",
 
+    # Result storage — only tasks that opt in (ignore_result=False) write to
+    # the backend, with minimal metadata, and results are reaped after an hour.
+    task_ignore_result=True,
+    result_extended=False,
+    result_expires=RESULT_TTL,
+
     # Timeouts — Modal cold-start adds ~30-60 s on top of the 30 s execution timeout.
+    # Only prefork workers enforce these; under -P threads run_algorithm bounds
+    # its Modal call with MODAL_CALL_TIMEOUT (the soft limit) instead.
     task_time_limit=90,
     task_soft_time_limit=75,
 
@@ -55,10 +70,94 @@ celery.conf.update(
     redis_max_connections=10,
 
     # Worker config
+    # Tasks only wait on Modal (the solvers run there), so workers should use an
+    # I/O pool. main.py starts one with --pool=threads; a standalone worker can
+    # be run as: celery -A app.celery_app worker -P threads -c 8 -Q celery
     worker_prefetch_multiplier=1,        # one task at a time per worker
     task_acks_late=True,                 # only ack after task completes
     worker_cancel_long_running_tasks_on_connection_loss=True,
 )
 
+# Shared asyncio connection pool for request handlers (e.g. SSE streams) that
+# read the result backend directly — one pool per process instead of one
+# client per request. TLS settings mirror redis_backend_use_ssl above.
+REDIS_POOL = None
+if REDIS_URL:
+    REDIS_POOL = aioredis.ConnectionPool.from_url(
+        REDIS_URL,
+        max_connections=64,
+        decode_responses=True,
+        **({"ssl_cert_reqs": "none"} if REDIS_URL.startswith("rediss://") else {}),
+    )
+
+# Identical submissions (same algorithm, problem and params) within this window
+# are answered with the task id of the first one instead of re-running.
+DEDUPE_TTL = RESULT_TTL
+
+
+# Replace / delete a dedupe key only while it still holds the id we read, so
+# concurrent submissions cannot both take over the same failed entry.
+_REPLACE_IF_EQUAL = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+    return 1
+end
+return 0
+"""
+_DELETE_IF_EQUAL = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+def _dedupe_key(key_parts) -> str:
+    digest = hashlib.sha256(orjson.dumps(key_parts, option=orjson.OPT_SORT_KEYS)).hexdigest()
+    return f"dedupe:{digest}"
+
+
+def claim_task_id(*key_parts) -> tuple:
+    """
+    Resolve the task id for a submission identified by ``key_parts``.
+
+    Returns ``(task_id, is_new)``. When ``is_new`` is False an identical task
+    was submitted within DEDUPE_TTL and its id should be reused; its stored
+    result (or live updates) are served from the result backend as usual.
+    A previous submission that failed or was revoked is not reused.
+
+    A new id is recorded immediately; if the task then cannot be enqueued the
+    caller must hand it back with ``release_task_id``.
+    """
+    key = _dedupe_key(key_parts)
+    task_id = str(uuid4())
+    client = celery.backend.client
+
+    while True:
+        if client.set(key, task_id, nx=True, ex=DEDUPE_TTL):
+            return task_id, True
+
+        existing = client.get(key)
+        if existing is None:
+            continue  # expired between SET NX and GET — claim it again
+        if isinstance(existing, bytes):
+            existing = existing.decode()
+        if celery.backend.get_state(existing) not in ("FAILURE", "REVOKED"):
+            return existing, False
+        if client.eval(_REPLACE_IF_EQUAL, 1, key, existing, task_id, DEDUPE_TTL):
+            return task_id, True
+        # Another submission replaced the failed id first; reuse whatever it wrote
+
+
+def release_task_id(task_id: str, *key_parts) -> None:
+    """
+    Drop the dedupe entry for ``key_parts`` if it still points at ``task_id``.
+
+    Used when a claimed task could not be enqueued, so identical resubmissions
+    are not answered with an id that will never run.
+    """
+    celery.backend.client.eval(_DELETE_IF_EQUAL, 1, _dedupe_key(key_parts), task_id)
+
+
 # Explicitly import tasks to ensure registration
 import app.tasks
@@ -1,7 +1,9 @@
 """
 Configuration settings and algorithm registry for OptimizeHub.
 """
-from typing import Dict, Any
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple
 
 
 # ==============================================================================
@@ -17,35 +19,76 @@ MAX_ITERATIONS = 100
 EXECUTION_TIMEOUT = 30
 """Maximum execution time in seconds."""
 
+SSE_KEEPALIVE_INTERVAL = 15
+"""Seconds of silence after which an SSE stream sends a keepalive comment."""
+
+SSE_MAX_LIFETIME = 10 * EXECUTION_TIMEOUT
+"""Maximum lifetime of an SSE stream in seconds (covers queueing, Modal cold starts and retries)."""
+
 
 # ==============================================================================
 # Algorithm Registry
 # ==============================================================================
 
-ALGORITHM_REGISTRY: Dict[str, Dict[str, Any]] = {
-    'particle_swarm': {
-        'status': 'available',
-        'display_name': 'Particle Swarm Optimization',
-        'class_name': 'ParticleSwarmOptimization',
-        'module': 'app.algorithms.particle_swarm',
-        'description': (
+def _freeze(value: Any) -> Any:
+    """Read-only copy of a nested dict/list literal (dicts become mapping proxies, lists tuples)."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+@dataclass(frozen=True, slots=True)
+class AlgorithmSpec:
+    """
+    Static description of a registered algorithm.
+
+    The mapping fields are frozen on construction, so specs can be shared
+    without callers changing the registry through them; copy before merging
+    or serializing.
+    """
+    status: str
+    display_name: str
+    class_name: str
+    module: str
+    description: str
+    default_params: Mapping[str, Any]
+    parameter_info: Mapping[str, Mapping[str, Any]] = field(default_factory=dict)
+    use_cases: Tuple[str, ...] = ()
+    characteristics: Optional[Mapping[str, Any]] = None
+
+    def __post_init__(self):
+        for name in ('default_params', 'parameter_info', 'characteristics'):
+            value = getattr(self, name)
+            if value is not None:
+                object.__setattr__(self, name, _freeze(value))
+
+
+_ALGORITHM_REGISTRY: Dict[str, AlgorithmSpec] = {
+    'particle_swarm': AlgorithmSpec(
+        status='available',
+        display_name='Particle Swarm Optimization',
+        class_name='ParticleSwarmOptimization',
+        module='app.algorithms.particle_swarm',
+        description=(
             'Bio-inspired algorithm simulating social behavior of birds flocking. '
             'Particles move through the search space influenced by their own best '
             'position and the swarm\'s global best position.'
         ),
-        'use_cases': [
+        use_cases=(
             'Continuous optimization',
             'Non-convex problems',
             'Multi-modal landscapes'
-        ],
-        'default_params': {
+        ),
+        default_params={
             'swarm_size': 30,
             'max_iterations': 50,
             'w': 0.7,
             'c1': 1.5,
             'c2': 1.5
         },
-        'parameter_info': {
+        parameter_info={
             'swarm_size': {
                 'type': 'int',
                 'min': 10,
@@ -74,31 +117,31 @@ ALGORITHM_REGISTRY: Dict[str, Dict[str, Any]] = {
                 'recommendation': '1.0-2.0'
             }
         }
-    },
-
-    'genetic_algorithm': {
-        'status': 'available',  
-        'display_name': 'Genetic Algorithm',
-        'class_name': 'GeneticAlgorithm',
-        'module': 'app.algorithms.genetic_algorithm',
-        'description': (
+    ),
+
+    'genetic_algorithm': AlgorithmSpec(
+        status='available',  
+        display_name='Genetic Algorithm',
+        class_name='GeneticAlgorithm',
+        module='app.algorithms.genetic_algorithm',
+        description=(
             'Evolutionary algorithm inspired by natural selection. '
             'Uses selection, crossover, and mutation operators to evolve '
             'a population of candidate solutions towards better fitness.'
         ),
-        'use_cases': [
+        use_cases=(
             'Discrete and continuous optimization',
             'Combinatorial problems',
             'Multi-objective optimization'
-        ],
-        'default_params': {
+        ),
+        default_params={
             'population_size': 50,
             'max_iterations': 50,
             'crossover_rate': 0.8,
             'mutation_rate': 0.1,
             'tournament_size': 3
         },
-        'parameter_info': {
+        parameter_info={
             'population_size': {
                 'type': 'int',
                 'min': 10,
@@ -132,30 +175,30 @@ ALGORITHM_REGISTRY: Dict[str, Dict[str, Any]] = {
                 'recommendation': '2-5'
             }
         }
-    },
-
-    'differential_evolution': {
-        'status': 'available',  
-        'display_name': 'Differential Evolution',
-        'class_name': 'DifferentialEvolution',
-        'module': 'app.algorithms.differential_evolution',
-        'description': (
+    ),
+
+    'differential_evolution': AlgorithmSpec(
+        status='available',  
+        display_name='Differential Evolution',
+        class_name='DifferentialEvolution',
+        module='app.algorithms.differential_evolution',
+        description=(
             'Population-based optimization algorithm that creates new candidates '
             'by combining existing solutions using vector differences. '
             'Particularly effective for continuous optimization problems.'
         ),
-        'use_cases': [
+        use_cases=(
             'Continuous optimization',
             'Global optimization',
             'Non-differentiable functions'
-        ],
-        'default_params': {
+        ),
+        default_params={
             'population_size': 50,
             'max_iterations': 50,
             'F': 0.8,  
             'CR': 0.9  
         },
-        'parameter_info': {
+        parameter_info={
             'population_size': {
                 'type': 'int',
                 'min': 10,
@@ -183,23 +226,23 @@ ALGORITHM_REGISTRY: Dict[str, Dict[str, Any]] = {
                 'recommendation': '0.7-0.9'
             }
         }
-    },
-
-    'simulated_annealing': {
-        'status': 'available',
-        'display_name': 'Simulated Annealing',
-        'class_name': 'SimulatedAnnealing',
-        'module': 'app.algorithms.simulated_annealing',
-        'description': (
+    ),
+
+    'simulated_annealing': AlgorithmSpec(
+        status='available',
+        display_name='Simulated Annealing',
+        class_name='SimulatedAnnealing',
+        module='app.algorithms.simulated_annealing',
+        description=(
             'Probabilistic optimization technique inspired by metallurgy annealing process. '
             'Accepts worse solutions with decreasing probability to escape local minima.'
         ),
-        'use_cases': [
+        use_cases=(
             'Continuous optimization',
             'Rugged landscapes',
             'Avoiding local minima'
-        ],
-        'default_params': {
+        ),
+        default_params={
             'initial_temp': 100.0,
             'final_temp': 0.01,
             'cooling_rate': 0.95,
@@ -207,7 +250,7 @@ ALGORITHM_REGISTRY: Dict[str, Dict[str, Any]] = {
             'neighbor_std': 0.1,
             'cooling_schedule': 'geometric'
         },
-        'parameter_info': {
+        parameter_info={
             'initial_temp': {
                 'type': 'float',
                 'min': 0.1,
@@ -247,31 +290,31 @@ ALGORITHM_REGISTRY: Dict[str, Dict[str, Any]] = {
                 'recommendation': 'geometric (default, fast convergence)'
             }
         }
-    },
-
-    'ant_colony': {
-        'status': 'available',
-        'display_name': 'Ant Colony Optimization for Continuous Domains',
-        'class_name': 'AntColonyOptimization',
-        'module': 'app.algorithms.ant_colony',
-        'description': (
+    ),
+
+    'ant_colony': AlgorithmSpec(
+        status='available',
+        display_name='Ant Colony Optimization for Continuous Domains',
+        class_name='AntColonyOptimization',
+        module='app.algorithms.ant_colony',
+        description=(
             'ACOR (Ant Colony Optimization for Continuous domains) uses an archive-based '
             'approach where ants sample solutions from a weighted archive of good solutions '
             'using Gaussian distributions. Particularly effective for continuous optimization.'
         ),
-        'use_cases': [
+        use_cases=(
             'Continuous optimization',
             'Multi-modal landscapes',
             'Global optimization'
-        ],
-        'default_params': {
+        ),
+        default_params={
             'colony_size': 30,
             'max_iterations': 50,
             'archive_size': 10,
             'q': 0.01,
             'xi': 0.85
         },
-        'parameter_info': {
+        parameter_info={
             'colony_size': {
                 'type': 'int',
                 'min': 5,
@@ -304,39 +347,57 @@ ALGORITHM_REGISTRY: Dict[str, Dict[str, Any]] = {
                 'recommendation': '0.7-0.95'
             }
         }
-    }
+    )
 }
 
 
+# The registry is static after import: expose it read-only and precompute the
+# status partitions the helpers below would otherwise rebuild on every call.
+ALGORITHM_REGISTRY: Mapping[str, AlgorithmSpec] = MappingProxyType(_ALGORITHM_REGISTRY)
+
+_AVAILABLE_ALGOS = tuple(
+    name for name, spec in ALGORITHM_REGISTRY.items()
+    if spec.status == 'available'
+)
+_COMING_SOON_ALGOS = tuple(
+    name for name, spec in ALGORITHM_REGISTRY.items()
+    if spec.status == 'coming_soon'
+)
+_AVAILABLE_ALGOS_SET = frozenset(_AVAILABLE_ALGOS)
+
+# Registry overview logged at startup; the registry is static, so it is
+# formatted once here instead of in the app lifespan.
+REGISTRY_SUMMARY = "\n".join([
+    f"Available algorithms: {', '.join(_AVAILABLE_ALGOS) or 'None'}",
+    f"Total registered algorithms: {len(ALGORITHM_REGISTRY)}",
+    *(
+        f"  {'[OK]' if spec.status == 'available' else '[PENDING]'} "
+        f"{spec.display_name} ({name}): {spec.status}"
+        for name, spec in ALGORITHM_REGISTRY.items()
+    ),
+])
+
+
 # ==============================================================================
 # Helper Functions
 # ==============================================================================
 
 def get_available_algorithms() -> list:
     """Get list of algorithm names that are currently available."""
-    return [
-        name for name, info in ALGORITHM_REGISTRY.items()
-        if info['status'] == 'available'
-    ]
+    return list(_AVAILABLE_ALGOS)
 
 
 def get_coming_soon_algorithms() -> list:
     """Get list of algorithm names that are in development."""
-    return [
-        name for name, info in ALGORITHM_REGISTRY.items()
-        if info['status'] == 'coming_soon'
-    ]
+    return list(_COMING_SOON_ALGOS)
 
 
 def is_algorithm_available(algorithm_name: str) -> bool:
     """Check if an algorithm is available for use."""
-    return (
-        algorithm_name in ALGORITHM_REGISTRY and
-        ALGORITHM_REGISTRY[algorithm_name]['status'] == 'available'
-    )
+    return algorithm_name in _AVAILABLE_ALGOS_SET
 
 
-def get_algorithm_info(algorithm_name: str) -> Dict[str, Any]:
+def get_algorithm_info(algorithm_name: str) -> AlgorithmSpec:
     """Get information about a specific algorithm."""
     if algorithm_name not in ALGORITHM_REGISTRY:
         raise ValueError(f"Unknown algorithm: {algorithm_name}")
@@ -1,7 +1,20 @@
 """
 Real-world optimization problem definitions.
 These can be solved using optimization algorithms with custom fitness functions.
+
+Fitness functions built here may carry a ``batch`` attribute: a vectorized
+variant taking a (pop_size, dimensions) matrix and returning a (pop_size,)
+fitness vector. Population-based algorithms use it when present.
+
+The fitness functions built here are safe to call from several threads at
+once (see ``evaluate_population``). A fitness function that is not should
+set ``thread_safe = False``; parallel evaluation then refuses it.
 """
+import copy
+import heapq
+import threading
+from types import MappingProxyType
+
 import numpy as np
 from typing import List, Tuple, Dict, Any, Callable
 
@@ -10,12 +23,17 @@ from typing import List, Tuple, Dict, Any, Callable
 # Traveling Salesman Problem (TSP) / Shortest Path
 # ==============================================================================
 
-def create_tsp_fitness(cities: List[Tuple[float, float]]) -> Callable:
+def create_tsp_fitness(
+    cities: List[Tuple[float, float]],
+    encoding: str = 'random_key'
+) -> Callable:
     """
     Create a fitness function for the Traveling Salesman Problem.
     
     Args:
         cities: List of (x, y) coordinates for each city
+        encoding: 'random_key' (solution values are ranked into a tour) or
+                  'permutation' (solution is already the tour as city indices)
         
     Returns:
         Fitness function that calculates total tour distance
@@ -25,22 +43,32 @@ def create_tsp_fitness(cities: List[Tuple[float, float]]) -> Callable:
         fitness_fn = create_tsp_fitness(cities)
         # Solution is a permutation: [0, 2, 1, 3] means visit in that order
     """
-    n_cities = len(cities)
+    # Cities are fixed for the lifetime of the closure, so compute every
+    # pairwise distance once instead of on each evaluation. The matrix is
+    # stored as float32 to halve its footprint (and the bytes each tour gathers);
+    # tour lengths are still accumulated in float64.
+    coords = np.asarray(cities, dtype=np.float64)
+    diff = coords[:, None, :] - coords[None, :, :]
+    dist_matrix = np.sqrt((diff ** 2).sum(axis=-1)).astype(np.float32)
+    is_permutation = encoding == 'permutation'
     
     def tsp_fitness(solution: np.ndarray) -> float:
         """Calculate total distance of tour."""
         # Convert continuous values to permutation (rankings)
-        tour = np.argsort(solution)
+        tour = np.asarray(solution, dtype=np.intp) if is_permutation else np.argsort(solution)
         
-        total_distance = 0.0
-        for i in range(n_cities):
-            city_a = cities[tour[i]]
-            city_b = cities[tour[(i + 1) % n_cities]]  # Return to start
-            distance = np.sqrt((city_a[0] - city_b[0])**2 + (city_a[1] - city_b[1])**2)
-            total_distance += distance
-            
-        return total_distance
+        # Each city to the next, plus the closing leg back to the start
+        return float(dist_matrix[tour[:-1], tour[1:]].sum(dtype=np.float64) + dist_matrix[tour[-1], tour[0]])
     
+    def tsp_fitness_batch(solutions: np.ndarray) -> np.ndarray:
+        """Calculate total tour distance for every row of a population."""
+        tours = np.asarray(solutions, dtype=np.intp) if is_permutation else np.argsort(solutions, axis=1)
+        return (
+            dist_matrix[tours[:, :-1], tours[:, 1:]].sum(axis=1, dtype=np.float64)
+            + dist_matrix[tours[:, -1], tours[:, 0]]
+        )
+    
+    tsp_fitness.batch = tsp_fitness_batch
     return tsp_fitness
 
 
@@ -74,17 +102,18 @@ def create_knapsack_fitness(
         # Solution in [0, 1] for each item - threshold at 0.5
     """
     n_items = len(weights)
+    weights_arr = np.asarray(weights, dtype=np.float64)
+    values_arr = np.asarray(values, dtype=np.float64)
     
     def knapsack_fitness(solution: np.ndarray) -> float:
         """
         Calculate negative value (since we minimize).
         Returns: -total_value if valid, penalty if over capacity
         """
-        # Convert continuous [0,1] to binary [0 or 1]
-        selected = (solution > 0.5).astype(int)
+        # Threshold continuous [0,1] values into a selection mask
+        selected = solution > 0.5
         
-        total_weight = np.sum(selected * weights)
-        total_value = np.sum(selected * values)
+        total_weight = weights_arr[selected].sum()
         
         # Penalty if over capacity
         if total_weight > capacity:
@@ -92,8 +121,20 @@ def create_knapsack_fitness(
             return penalty_factor * over_capacity  # High fitness = bad
         
         # Return negative value (minimize)
-        return -total_value
+        return -values_arr[selected].sum()
+    
+    def knapsack_fitness_batch(solutions: np.ndarray) -> np.ndarray:
+        """Calculate knapsack fitness for every row of a population."""
+        selected = solutions > 0.5
+        total_weight = selected @ weights_arr
+        total_value = selected @ values_arr
+        return np.where(
+            total_weight > capacity,
+            penalty_factor * (total_weight - capacity),
+            -total_value,
+        )
     
+    knapsack_fitness.batch = knapsack_fitness_batch
     return knapsack_fitness
 
 
@@ -106,7 +147,8 @@ def create_knapsack_fitness(
 
 def create_scheduling_fitness(
     processing_times: List[float],
-    n_machines: int = 1
+    n_machines: int = 1,
+    encoding: str = 'random_key'
 ) -> Callable:
     """
     Create a fitness function for Job Scheduling (minimize makespan).
@@ -114,6 +156,8 @@ def create_scheduling_fitness(
     Args:
         processing_times: Time required for each job
         n_machines: Number of machines available
+        encoding: 'random_key' (solution values are ranked into a job order) or
+                  'permutation' (solution is already the job order)
         
     Returns:
         Fitness function that minimizes makespan (completion time)
@@ -123,22 +167,31 @@ def create_scheduling_fitness(
         fitness_fn = create_scheduling_fitness(processing_times, n_machines=2)
     """
     n_jobs = len(processing_times)
+    processing_times_arr = np.asarray(processing_times, dtype=np.float64)
+    is_permutation = encoding == 'permutation'
+    
+    # On one machine every order finishes at the same time
+    single_machine_makespan = float(processing_times_arr.sum())
+    job_times = processing_times_arr.tolist()
     
     def scheduling_fitness(solution: np.ndarray) -> float:
         """Calculate makespan (max completion time across machines)."""
+        if n_machines == 1:
+            return single_machine_makespan
+        
         # Convert to job order
-        job_order = np.argsort(solution)
+        job_order = np.asarray(solution, dtype=np.intp) if is_permutation else np.argsort(solution)
         
-        # Assign jobs to machines in order
-        machine_times = np.zeros(n_machines)
+        # Assign jobs to machines in order, each to the least-loaded machine.
+        # (load, machine) pairs break ties on the lowest machine index.
+        machine_loads = [(0.0, m) for m in range(n_machines)]
         
-        for job_idx in job_order:
-            # Assign to machine with least load
-            min_machine = np.argmin(machine_times)
-            machine_times[min_machine] += processing_times[job_idx]
+        for job_idx in job_order.tolist():
+            load, machine = machine_loads[0]
+            heapq.heapreplace(machine_loads, (load + job_times[job_idx], machine))
         
         # Makespan is the maximum time
-        return float(np.max(machine_times))
+        return float(max(load for load, _ in machine_loads))
     
     return scheduling_fitness
 
@@ -162,31 +215,48 @@ def create_feature_selection_fitness(
     Args:
         X_train: Training features (n_samples, n_features)
         y_train: Training labels
-        model_evaluator: Function that returns model error given (X, y)
+        model_evaluator: Function that returns model error given (X, y).
+                         The X it receives is a view into a per-thread buffer
+                         reused across evaluations, so it must not keep a
+                         reference.
         alpha: Penalty for number of features selected
         
     Returns:
         Fitness function that balances accuracy and feature count
     """
     n_features = X_train.shape[1]
+    # Column-major scratch so every leading-column slice is contiguous. One
+    # buffer per thread, so concurrent evaluations (evaluate_population)
+    # never overwrite columns another model_evaluator call is still reading.
+    local = threading.local()
     
     def feature_selection_fitness(solution: np.ndarray) -> float:
         """
         Returns: model_error + alpha * n_features_selected
         """
-        # Convert to binary feature mask
-        selected = (solution > 0.5).astype(bool)
+        if np.shape(solution) != (n_features,):
+            raise ValueError(f"Expected {n_features} feature flags, got shape {np.shape(solution)}")
+
+        # Indices of selected features
+        selected_idx = np.flatnonzero(solution > 0.5)
+        n_selected = selected_idx.size
         
         # Need at least one feature
-        if not np.any(selected):
+        if n_selected == 0:
             return 1000.0  # High penalty
         
-        # Evaluate model with selected features
-        X_selected = X_train[:, selected]
+        scratch = getattr(local, 'scratch', None)
+        if scratch is None:
+            scratch = local.scratch = np.empty_like(X_train, order='F')
+        
+        # Evaluate model with selected features, gathered into the scratch
+        # buffer instead of a fresh array per evaluation. The shape check above
+        # keeps every index in range, and mode='clip' lets np.take write into
+        # out directly ('raise' buffers it internally).
+        X_selected = np.take(X_train, selected_idx, axis=1, out=scratch[:, :n_selected], mode='clip')
         error = model_evaluator(X_selected, y_train)
         
         # Add penalty for number of features
-        n_selected = np.sum(selected)
         fitness = error + alpha * (n_selected / n_features)
         
         return float(fitness)
@@ -226,6 +296,8 @@ def create_portfolio_fitness(
         # Solution: weights for each asset (normalized to sum to 1)
     """
     n_assets = len(returns)
+    returns_arr = np.asarray(returns, dtype=np.float64)
+    covariance_arr = np.ascontiguousarray(covariance, dtype=np.float64)
     
     def portfolio_fitness(solution: np.ndarray) -> float:
         """
@@ -233,14 +305,18 @@ def create_portfolio_fitness(
         Returns: negative (expected_return - risk_aversion * variance)
         """
         # Normalize weights to sum to 1
-        weights = np.abs(solution)
-        weights = weights / np.sum(weights) if np.sum(weights) > 0 else np.ones(n_assets) / n_assets
+        weights = np.abs(solution, dtype=np.float64)
+        total = weights.sum()
+        if total > 0:
+            weights /= total
+        else:
+            weights = np.full(n_assets, 1.0 / n_assets)
         
         # Expected return
-        portfolio_return = np.dot(weights, returns)
+        portfolio_return = weights @ returns_arr
         
-        # Portfolio variance
-        portfolio_variance = np.dot(weights, np.dot(covariance, weights))
+        # Portfolio variance (quadratic form, no intermediate vector)
+        portfolio_variance = np.einsum('i,ij,j->', weights, covariance_arr, weights)
         
         # Objective: maximize return - risk_aversion * variance
         # We minimize, so return negative
@@ -248,6 +324,18 @@ def create_portfolio_fitness(
         
         return -objective
     
+    def portfolio_fitness_batch(solutions: np.ndarray) -> np.ndarray:
+        """Calculate portfolio fitness for every row of a population."""
+        weights = np.abs(solutions)
+        totals = weights.sum(axis=1, keepdims=True)
+        weights = np.where(totals > 0, weights / np.where(totals > 0, totals, 1.0), 1.0 / n_assets)
+        
+        portfolio_returns = weights @ returns_arr
+        portfolio_variances = np.einsum('ij,jk,ik->i', weights, covariance_arr, weights)
+        
+        return -(portfolio_returns - risk_aversion * portfolio_variances)
+    
+    portfolio_fitness.batch = portfolio_fitness_batch
     return portfolio_fitness
 
 
@@ -255,7 +343,7 @@ def create_portfolio_fitness(
 # Problem Registry
 # ==============================================================================
 
-PROBLEM_TYPES = {
+_PROBLEM_TYPES = {
     'tsp': {
         'name': 'Traveling Salesman Problem',
         'description': 'Find shortest route visiting all cities',
@@ -286,9 +374,15 @@ PROBLEM_TYPES = {
 }
 
 
+# Read-only view so callers cannot corrupt the shared definitions
+PROBLEM_TYPES = MappingProxyType({
+    name: MappingProxyType(definition) for name, definition in _PROBLEM_TYPES.items()
+})
+
+
 def get_problem_example(problem_type: str) -> Dict[str, Any]:
-    """Get example configuration for a real-world problem."""
-    if problem_type not in PROBLEM_TYPES:
+    """Get example configuration for a real-world problem (a fresh deep copy)."""
+    if problem_type not in _PROBLEM_TYPES:
         raise ValueError(f"Unknown problem type: {problem_type}")
     
-    return PROBLEM_TYPES[problem_type]
+    return copy.deepcopy(_PROBLEM_TYPES[problem_type])
@@ -22,25 +22,18 @@ def decode_knapsack_solution(
     Returns:
         Dictionary with selected items and statistics
     """
-    # Convert to binary (threshold at 0.5)
-    selected_indices = [i for i, val in enumerate(solution) if val > 0.5]
-    
+    # Convert to binary (threshold at 0.5); genes beyond the item list are ignored
+    selected_indices = np.flatnonzero(np.asarray(solution, dtype=np.float64) > 0.5)
+    selected_indices = selected_indices[selected_indices < len(items)]
+
     # Get selected items
-    selected_items = []
-    total_weight = 0.0
-    total_value = 0.0
-    
-    for idx in selected_indices:
-        if idx < len(items):
-            item = items[idx]
-            selected_items.append({
-                'name': item['name'],
-                'weight': item['weight'],
-                'value': item['value']
-            })
-            total_weight += item['weight']
-            total_value += item['value']
-    
+    selected_items = [
+        {'name': items[i]['name'], 'weight': items[i]['weight'], 'value': items[i]['value']}
+        for i in selected_indices
+    ]
+    total_weight = float(np.fromiter((item['weight'] for item in selected_items), dtype=np.float64).sum())
+    total_value = float(np.fromiter((item['value'] for item in selected_items), dtype=np.float64).sum())
+
     return {
         'selected_items': selected_items,
         'total_items_selected': len(selected_items),
@@ -82,22 +75,21 @@ def decode_tsp_solution(
                 'y': city['y']
             })
     
-    # Calculate individual segment distances
+    # Calculate individual segment distances (last segment wraps to start)
     segments = []
-    for i in range(len(route)):
-        city_a = route[i]
-        city_b = route[(i + 1) % len(route)]  # Wrap to start
-        
-        distance = np.sqrt(
-            (city_a['x'] - city_b['x'])**2 + 
-            (city_a['y'] - city_b['y'])**2
-        )
+    if route:
+        xs = np.array([city['x'] for city in route], dtype=float)
+        ys = np.array([city['y'] for city in route], dtype=float)
+        distances = np.hypot(np.diff(xs, append=xs[0]), np.diff(ys, append=ys[0]))
         
-        segments.append({
-            'from': city_a['name'],
-            'to': city_b['name'],
-            'distance': round(distance, 2)
-        })
+        segments = [
+            {
+                'from': city_a['name'],
+                'to': city_b['name'],
+                'distance': round(float(distance), 2)
+            }
+            for city_a, city_b, distance in zip(route, route[1:] + route[:1], distances)
+        ]
     
     return {
         'route': route,
@@ -2,7 +2,9 @@
 Helper utility functions for optimization algorithms.
 """
 import numpy as np
-from typing import Callable, Dict, Any, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, Dict, Any, List, Optional, Tuple
 
 
 # ==============================================================================
@@ -15,7 +17,7 @@ def sphere(x: np.ndarray) -> float:
     Global minimum: f(0, ..., 0) = 0
     Domain: typically [-5.12, 5.12]
     """
-    return float(np.sum(x ** 2))
+    return float(x @ x)
 
 
 def rastrigin(x: np.ndarray) -> float:
@@ -26,7 +28,7 @@ def rastrigin(x: np.ndarray) -> float:
     Domain: typically [-5.12, 5.12]
     """
     n = len(x)
-    return float(10 * n + np.sum(x ** 2 - 10 * np.cos(2 * np.pi * x)))
+    return float(10 * n + x @ x - 10 * np.sum(np.cos(2 * np.pi * x)))
 
 
 def rosenbrock(x: np.ndarray) -> float:
@@ -46,22 +48,75 @@ def ackley(x: np.ndarray) -> float:
     Domain: typically [-32.768, 32.768]
     """
     n = len(x)
-    sum1 = np.sum(x ** 2)
+    sum1 = x @ x
     sum2 = np.sum(np.cos(2 * np.pi * x))
     return float(-20 * np.exp(-0.2 * np.sqrt(sum1 / n)) - np.exp(sum2 / n) + 20 + np.e)
 
 
+@lru_cache(maxsize=64)
+def _griewank_denom(n: int) -> np.ndarray:
+    """sqrt(1..n) for Griewank's product term; read-only since it is shared."""
+    denom = np.sqrt(np.arange(1, n + 1, dtype=np.float64))
+    denom.setflags(write=False)
+    return denom
+
+
 def griewank(x: np.ndarray) -> float:
     """
     Griewank function: multimodal function
     Global minimum: f(0, ..., 0) = 0
     Domain: typically [-600, 600]
     """
-    sum_part = np.sum(x ** 2) / 4000
-    prod_part = np.prod(np.cos(x / np.sqrt(np.arange(1, len(x) + 1))))
+    sum_part = (x @ x) / 4000
+    prod_part = np.prod(np.cos(x / _griewank_denom(len(x))))
     return float(sum_part - prod_part + 1)
 
 
+# ==============================================================================
+# Batched Benchmark Functions
+# ==============================================================================
+# Same functions over a (pop_size, dimensions) population, returning one value
+# per row. Attached as ``<fn>.batch`` so population-based algorithms can score
+# a whole generation in one call (see GeneticAlgorithm._evaluate_population).
+
+def sphere_batch(X: np.ndarray) -> np.ndarray:
+    """Row-wise sphere function."""
+    return np.einsum('ij,ij->i', X, X)
+
+
+def rastrigin_batch(X: np.ndarray) -> np.ndarray:
+    """Row-wise Rastrigin function."""
+    n = X.shape[1]
+    return 10 * n + np.einsum('ij,ij->i', X, X) - 10 * np.cos(2 * np.pi * X).sum(axis=1)
+
+
+def rosenbrock_batch(X: np.ndarray) -> np.ndarray:
+    """Row-wise Rosenbrock function."""
+    return (100 * (X[:, 1:] - X[:, :-1] ** 2) ** 2 + (1 - X[:, :-1]) ** 2).sum(axis=1)
+
+
+def ackley_batch(X: np.ndarray) -> np.ndarray:
+    """Row-wise Ackley function."""
+    n = X.shape[1]
+    sum1 = np.einsum('ij,ij->i', X, X)
+    sum2 = np.cos(2 * np.pi * X).sum(axis=1)
+    return -20 * np.exp(-0.2 * np.sqrt(sum1 / n)) - np.exp(sum2 / n) + 20 + np.e
+
+
+def griewank_batch(X: np.ndarray) -> np.ndarray:
+    """Row-wise Griewank function."""
+    sum_part = np.einsum('ij,ij->i', X, X) / 4000
+    prod_part = np.prod(np.cos(X / _griewank_denom(X.shape[1])), axis=1)
+    return sum_part - prod_part + 1
+
+
+sphere.batch = sphere_batch
+rastrigin.batch = rastrigin_batch
+rosenbrock.batch = rosenbrock_batch
+ackley.batch = ackley_batch
+griewank.batch = griewank_batch
+
+
 # Fitness function registry
 FITNESS_FUNCTIONS: Dict[str, Callable] = {
     'sphere': sphere,
@@ -97,6 +152,38 @@ def get_fitness_function(name: str) -> Callable:
     return FITNESS_FUNCTIONS[name]
 
 
+def evaluate_population(
+    fitness_fn: Callable,
+    population: np.ndarray,
+    n_jobs: Optional[int] = None
+) -> np.ndarray:
+    """
+    Evaluate fitness_fn on every individual concurrently in a thread pool.
+
+    Only pays off for expensive fitness functions that spend their time in
+    code releasing the GIL (large BLAS products, model training); cheap
+    benchmark functions are faster evaluated serially or via ``fn.batch``.
+
+    fitness_fn is called from several threads at once; functions marked
+    ``thread_safe = False`` are rejected.
+
+    Args:
+        fitness_fn: Callable taking one individual and returning a float
+        population: Array of shape (pop_size, dimensions)
+        n_jobs: Number of worker threads (None = executor default)
+
+    Returns:
+        Array of shape (pop_size,) with the fitness of each individual
+
+    Raises:
+        ValueError: If fitness_fn is marked as not thread-safe
+    """
+    if not getattr(fitness_fn, 'thread_safe', True):
+        raise ValueError("Fitness function is not thread-safe and cannot be evaluated in parallel")
+    with ThreadPoolExecutor(max_workers=n_jobs) as pool:
+        return np.fromiter(pool.map(fitness_fn, population), dtype=float, count=len(population))
+
+
 def create_problem_dict(
     dimensions: int,
     bounds: List[tuple],
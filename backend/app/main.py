@@ -2,6 +2,7 @@
 FastAPI application entry point for OptimizeHub.
 """
 # Standard library — no app imports yet
+import asyncio
 import logging
 import os
 import threading
@@ -25,17 +26,20 @@ if not REDIS_URL:
     )
 
 # App imports — safe to do after load_dotenv()
+import orjson
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.exceptions import RequestValidationError
 
 from app.api.async_tasks import router as async_router
-from app.api.routes import router
-from app.api.sse import router as sse_router
+from app.api.routes import router, build_algorithm_list_body, build_algorithm_list_etag
+from app.api.sse import router as sse_router, run_result_listener
 from app.api.auth import router as auth_router
 from app.api.persistence_routes import router as persistence_router
-from app.config import get_available_algorithms, ALGORITHM_REGISTRY
+from app.celery_app import REDIS_POOL
+from app.config import REGISTRY_SUMMARY
+from app.services.executor import AlgorithmExecutor
 
 # Configure logging
 logging.basicConfig(
@@ -45,6 +49,13 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# run_algorithm spends its time waiting on Modal, so a thread pool can keep
+# many more tasks in flight than forked processes for the same footprint.
+# The thread pool ignores Celery's time limits; tasks.MODAL_CALL_TIMEOUT
+# bounds each run instead.
+CELERY_CONCURRENCY = int(os.environ.get("CELERY_CONCURRENCY", "8"))
+
+
 def run_celery_worker():
     """Run Celery worker in a background thread alongside FastAPI."""
     try:
@@ -52,7 +63,8 @@ def run_celery_worker():
         celery.worker_main([
             "worker",
             "--loglevel=info",
-            "--concurrency=2",       # 2 concurrent task slots
+            "--pool=threads",        # I/O-bound tasks; no fork inside the API process
+            f"--concurrency={CELERY_CONCURRENCY}",
             "--without-gossip",      # reduces Redis chatter
             "--without-mingle",      # skips worker sync on startup
             "--without-heartbeat",   # reduces Redis chatter further
@@ -69,7 +81,10 @@ async def lifespan(app: FastAPI):
     Lifespan context manager for startup and shutdown events.
     """
     # Startup
-    logger.info("Starting OptimizeHub API...")
+    # Single executor shared by all requests (injected via routes.get_executor)
+    app.state.executor = AlgorithmExecutor()
+    app.state.algorithm_list_body = build_algorithm_list_body(app.state.executor)
+    app.state.algorithm_list_etag = build_algorithm_list_etag(app.state.algorithm_list_body)
 
     # Start Celery worker as daemon thread so it runs alongside FastAPI
     worker_thread = threading.Thread(
@@ -78,26 +93,33 @@ async def lifespan(app: FastAPI):
         name="celery-worker"
     )
     worker_thread.start()
-    logger.info(f"[startup] Celery worker thread started: {worker_thread.name}")
 
-    # Check available algorithms
-    available = get_available_algorithms()
-    logger.info(f"Available algorithms: {', '.join(available) if available else 'None'}")
+    # One pub/sub subscription feeding every SSE stream (see app.api.sse)
+    result_listener = asyncio.create_task(run_result_listener()) if REDIS_POOL else None
 
-    # Log all registered algorithms
-    logger.info(f"Total registered algorithms: {len(ALGORITHM_REGISTRY)}")
-    for name, info in ALGORITHM_REGISTRY.items():
-        status_indicator = "[OK]" if info['status'] == 'available' else "[PENDING]"
-        logger.info(f"  {status_indicator} {info['display_name']} ({name}): {info['status']}")
-
-    logger.info("OptimizeHub API started successfully")
+    # One record for the whole startup report; the algorithm summary is
+    # precomputed in app.config
+    logger.info(
+        "OptimizeHub API started successfully\n"
+        "[startup] Celery worker thread started: %s\n%s",
+        worker_thread.name, REGISTRY_SUMMARY,
+    )
 
     yield
 
     # Shutdown — daemon=True means the thread stops with the main process
-    logger.info("[shutdown] Celery worker thread will stop with main process")
-    logger.info("Shutting down OptimizeHub API...")
+    if result_listener is not None:
+        result_listener.cancel()
+    logger.info(
+        "Shutting down OptimizeHub API...\n"
+        "[shutdown] Celery worker thread will stop with main process"
+    )
+
 
+# Interactive docs and the OpenAPI schema behind them; set ENABLE_DOCS=0 in
+# production to skip building the schema and serving /docs, /redoc and
+# /openapi.json.
+ENABLE_DOCS = os.environ.get("ENABLE_DOCS", "1") == "1"
 
 # Create FastAPI application
 app = FastAPI(
@@ -109,8 +131,10 @@ app = FastAPI(
     ),
     version="1.0.0",
     lifespan=lifespan,
-    docs_url="/docs",
-    redoc_url="/redoc"
+    default_response_class=ORJSONResponse,
+    docs_url="/docs" if ENABLE_DOCS else None,
+    redoc_url="/redoc" if ENABLE_DOCS else None,
+    openapi_url="/openapi.json" if ENABLE_DOCS else None,
 )
 
 
@@ -119,20 +143,27 @@ app = FastAPI(
 # ==============================================================================
 
 # Configure CORS for frontend integration
-_default_origins = [
+_default_origins = (
     "http://localhost:3000",
     "http://localhost:5173",
     "http://localhost:8080",
     "http://127.0.0.1:3000",
     "http://127.0.0.1:5173",
     "http://127.0.0.1:8080",
-]
-_extra_origins = [
+)
+_extra_origins = tuple(
     o.strip()
     for o in os.environ.get("ALLOWED_ORIGINS", "").split(",")
     if o.strip()
-]
-_allowed_origins = _default_origins + _extra_origins
+)
+# A set, so CORSMiddleware's per-request `origin in allow_origins` check is a
+# hash lookup rather than a scan over the list
+_allowed_origins = frozenset(_default_origins + _extra_origins)
+
+# Let browsers cache preflight results for a day (they may cap it lower)
+# instead of Starlette's 10-minute default, so repeat POSTs skip the OPTIONS
+# round trip.
+CORS_MAX_AGE = 86400
 
 app.add_middleware(
     CORSMiddleware,
@@ -140,6 +171,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=CORS_MAX_AGE,
 )
 
 
@@ -152,15 +184,15 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     """
     Handle Pydantic validation errors with detailed error messages.
     """
-    errors = []
-    for error in exc.errors():
-        field = " -> ".join(str(loc) for loc in error['loc'])
-        message = error['msg']
-        errors.append(f"{field}: {message}")
+    # Also returned in the response body, so built regardless of log level
+    errors = [
+        f"{' -> '.join(str(loc) for loc in error['loc'])}: {error['msg']}"
+        for error in exc.errors()
+    ]
 
-    logger.warning(f"Validation error on {request.url.path}: {errors}")
+    logger.warning("Validation error on %s: %s", request.url.path, errors)
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "error": "Validation Error",
@@ -174,15 +206,18 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 async def general_exception_handler(request: Request, exc: Exception):
     """
     Handle unexpected exceptions gracefully.
+
+    Only reached for errors no route handled; HTTPException responses are
+    produced by FastAPI's own handler and never get here. The exception is
+    logged with its traceback but not echoed back to the client.
     """
-    logger.error(f"Unhandled exception on {request.url.path}: {str(exc)}", exc_info=True)
+    logger.exception("Unhandled exception on %s", request.url.path)
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "error": "Internal Server Error",
-            "detail": "An unexpected error occurred while processing your request",
-            "message": str(exc)
+            "detail": "An unexpected error occurred while processing your request"
         }
     )
 
@@ -202,26 +237,29 @@ app.include_router(persistence_router, tags=["Persistence"])
 # Root Endpoint
 # ==============================================================================
 
+_ROOT_BODY = orjson.dumps({
+    "message": "Welcome to OptimizeHub API",
+    "version": "1.0.0",
+    "status": "operational",
+    "documentation": {
+        "interactive": "/docs",
+        "redoc": "/redoc"
+    },
+    "endpoints": {
+        "health": "/api/health",
+        "algorithms": "/api/algorithms",
+        "optimize": "/api/optimize",
+        "validate": "/api/validate"
+    }
+})
+
+
 @app.get("/")
-async def root():
+async def root() -> Response:
     """
-    Root endpoint - API information.
+    Root endpoint - API information (pre-encoded at import).
     """
-    return {
-        "message": "Welcome to OptimizeHub API",
-        "version": "1.0.0",
-        "status": "operational",
-        "documentation": {
-            "interactive": "/docs",
-            "redoc": "/redoc"
-        },
-        "endpoints": {
-            "health": "/api/health",
-            "algorithms": "/api/algorithms",
-            "optimize": "/api/optimize",
-            "validate": "/api/validate"
-        }
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 # ==============================================================================
@@ -231,12 +269,24 @@ async def root():
 if __name__ == "__main__":
     import uvicorn
 
-    logger.info("Starting development server...")
+    # DEV_RELOAD=1 runs a single auto-reloading process for local development;
+    # otherwise serve with WEB_CONCURRENCY worker processes (each starts its
+    # own Celery worker thread in the lifespan).
+    dev_reload = os.environ.get("DEV_RELOAD") == "1"
+    workers = 1 if dev_reload else int(os.environ.get("WEB_CONCURRENCY", "2"))
+
+    if dev_reload:
+        logger.info("Starting development server...")
+    else:
+        logger.info("Starting server with %s workers...", workers)
 
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        reload=dev_reload,
+        workers=workers,
+        loop="auto",  # picks uvloop when installed (not available on Windows)
+        http="auto",  # picks httptools when installed
         log_level="info"
     )
@@ -1,8 +1,20 @@
 """
 Pydantic models for optimization problem input validation.
 """
-from typing import List, Tuple, Optional, Literal, Dict, Any
-from pydantic import BaseModel, Field, field_validator
+from typing import Annotated, List, Tuple, Optional, Literal, Dict, Any
+from pydantic import AfterValidator, BaseModel, Field, field_validator, model_validator
+
+
+def _check_bound_order(bound: Tuple[float, float]) -> Tuple[float, float]:
+    """Reject a (lower, upper) pair whose lower bound is not below the upper."""
+    lower, upper = bound
+    if lower >= upper:
+        raise ValueError(f"lower ({lower}) must be < upper ({upper})")
+    return bound
+
+
+# Pair length and numeric coercion are enforced by pydantic-core itself
+Bound = Annotated[Tuple[float, float], AfterValidator(_check_bound_order)]
 
 
 class ProblemInput(BaseModel):
@@ -20,7 +32,7 @@ class ProblemInput(BaseModel):
         description="Number of dimensions in the optimization problem (1-50)"
     )
 
-    bounds: List[Tuple[float, float]] = Field(
+    bounds: List[Bound] = Field(
         ...,
         description="List of (lower, upper) bound tuples for each dimension"
     )
@@ -58,46 +70,20 @@ class ProblemInput(BaseModel):
         description="List of cities for TSP with {name, x, y}"
     )
 
-    @field_validator('bounds')
-    @classmethod
-    def validate_bounds(cls, v, info):
-        """Validate bounds structure and values."""
+    @model_validator(mode='after')
+    def validate_bounds(self):
+        """Check that there is one bound per dimension."""
         # For real-world problems, bounds will be set by the executor
-        if info.data.get('problem_type') in ['knapsack', 'tsp']:
-            # Bounds will be automatically set to [0, 1] for each dimension
-            return v if v else []
-        
-        if 'dimensions' not in info.data:
-            return v
+        # (automatically [0, 1] for each dimension)
+        if self.problem_type in ('knapsack', 'tsp'):
+            return self
 
-        dimensions = info.data['dimensions']
-
-        # Check length matches dimensions
-        if len(v) != dimensions:
+        if len(self.bounds) != self.dimensions:
             raise ValueError(
-                f"Bounds length ({len(v)}) must match dimensions ({dimensions})"
+                f"Bounds length ({len(self.bounds)}) must match dimensions ({self.dimensions})"
             )
 
-        # Validate each bound
-        for i, bound in enumerate(v):
-            if len(bound) != 2:
-                raise ValueError(
-                    f"Bound at index {i} must be a tuple of (lower, upper), got {bound}"
-                )
-
-            lower, upper = bound
-
-            if not isinstance(lower, (int, float)) or not isinstance(upper, (int, float)):
-                raise ValueError(
-                    f"Bound at index {i} must contain numeric values, got {bound}"
-                )
-
-            if lower >= upper:
-                raise ValueError(
-                    f"Invalid bound at index {i}: lower ({lower}) must be < upper ({upper})"
-                )
-
-        return v
+        return self
 
     class Config:
         json_schema_extra = {
@@ -36,6 +36,14 @@ class DockerExecutor:
         self.timeout = timeout
         self.memory_limit = memory_limit
         self.cpu_limit = cpu_limit
+        self._modal_fn = None
+
+    def _get_modal_function(self):
+        """Deployed Modal function, looked up once and reused for every call."""
+        if self._modal_fn is None:
+            import modal
+            self._modal_fn = modal.Function.from_name("optimizehub-executor", "run_with_custom_fitness")
+        return self._modal_fn
 
     def execute_custom_fitness(
         self,
@@ -80,8 +88,7 @@ class DockerExecutor:
         params: dict = {**algo_parameters, "problem": problem_cfg}
 
         try:
-            import modal
-            run_with_custom_fitness = modal.Function.from_name("optimizehub-executor", "run_with_custom_fitness")
+            run_with_custom_fitness = self._get_modal_function()
 
             logger.info(
                 "Dispatching custom fitness run to Modal "
@@ -10,10 +10,11 @@ and Celery tasks do not need modification.
 """
 
 import time
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Mapping, Optional
 
 from app.config import (
     ALGORITHM_REGISTRY,
+    AlgorithmSpec,
     is_algorithm_available,
     get_algorithm_info,
     EXECUTION_TIMEOUT,
@@ -21,6 +22,15 @@ from app.config import (
 from app.core.utils import get_fitness_function
 
 
+def _plain(value: Any) -> Any:
+    """Mutable copy of a frozen registry value (mapping proxies become dicts, tuples lists)."""
+    if isinstance(value, Mapping):
+        return {key: _plain(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_plain(item) for item in value]
+    return value
+
+
 class AlgorithmExecutor:
     """
     Service class for executing optimization algorithms.
@@ -31,6 +41,7 @@ class AlgorithmExecutor:
 
     def __init__(self):
         self.registry = ALGORITHM_REGISTRY
+        self._modal_run = None
 
     # ------------------------------------------------------------------
     # Public API
@@ -143,6 +154,19 @@ class AlgorithmExecutor:
 
         return None
 
+    def _get_modal_run(self):
+        """
+        Deployed Modal ``run_algorithm`` function, looked up once per executor.
+
+        Looked up by app/function name (avoids importing modal_runner locally,
+        which creates a disconnected app object). Reusing the handle means only
+        the first run pays for resolving it.
+        """
+        if self._modal_run is None:
+            import modal
+            self._modal_run = modal.Function.from_name("optimizehub-executor", "run_algorithm")
+        return self._modal_run
+
     def _execute_via_modal(
         self,
         algorithm_name: str,
@@ -159,14 +183,9 @@ class AlgorithmExecutor:
 
         # Merge registry defaults with caller-supplied params
         algo_info = get_algorithm_info(algorithm_name)
-        merged_params = {**algo_info["default_params"], **params}
-
-        # Look up the deployed Modal function by app/function name
-        # (avoids importing modal_runner locally, which creates a disconnected app object)
-        import modal
-        _modal_run = modal.Function.from_name("optimizehub-executor", "run_algorithm")
+        merged_params = {**algo_info.default_params, **params}
 
-        raw_result: dict = _modal_run.remote(algorithm_name, problem, merged_params)
+        raw_result: dict = self._get_modal_run().remote(algorithm_name, problem, merged_params)
 
         wall_time = time.time() - wall_start
 
@@ -195,10 +214,10 @@ class AlgorithmExecutor:
     def _create_not_implemented_result(
         self,
         algorithm_name: str,
-        algorithm_info: Dict[str, Any],
+        algorithm_info: AlgorithmSpec,
     ) -> Dict[str, Any]:
         return {
-            "algorithm": algorithm_info.get("display_name", algorithm_name),
+            "algorithm": algorithm_info.display_name,
             "status": "not_implemented",
             "best_solution": None,
             "best_fitness": None,
@@ -207,7 +226,7 @@ class AlgorithmExecutor:
             "iterations_completed": None,
             "execution_time": None,
             "error_message": (
-                f"Algorithm '{algorithm_info.get('display_name', algorithm_name)}' "
+                f"Algorithm '{algorithm_info.display_name}' "
                 "is not yet implemented. Status: Coming Soon"
             ),
         }
@@ -236,19 +255,16 @@ class AlgorithmExecutor:
 
     def get_algorithm_list(self) -> Dict[str, Any]:
         algorithms = []
-        for name, info in self.registry.items():
-            algo_dict = {
+        for name, spec in self.registry.items():
+            algorithms.append({
                 "name": name,
-                "display_name": info["display_name"],
-                "status": info["status"],
-                "description": info["description"],
-                "default_params": info["default_params"],
-            }
-            if "parameter_info" in info:
-                algo_dict["parameter_info"] = info["parameter_info"]
-            if "use_cases" in info:
-                algo_dict["use_cases"] = info["use_cases"]
-            algorithms.append(algo_dict)
+                "display_name": spec.display_name,
+                "status": spec.status,
+                "description": spec.description,
+                "default_params": _plain(spec.default_params),
+                "parameter_info": _plain(spec.parameter_info),
+                "use_cases": list(spec.use_cases),
+            })
 
         available_count = sum(1 for a in algorithms if a["status"] == "available")
         coming_soon_count = sum(1 for a in algorithms if a["status"] == "coming_soon")
@@ -264,21 +280,21 @@ class AlgorithmExecutor:
         if algorithm_name not in self.registry:
             return None
 
-        info = self.registry[algorithm_name]
+        spec = self.registry[algorithm_name]
         details = {
             "name": algorithm_name,
-            "display_name": info["display_name"],
-            "status": info["status"],
-            "description": info["description"],
-            "use_cases": info.get("use_cases", []),
-            "default_params": info["default_params"],
-            "parameter_info": info.get("parameter_info", {}),
+            "display_name": spec.display_name,
+            "status": spec.status,
+            "description": spec.description,
+            "use_cases": list(spec.use_cases),
+            "default_params": _plain(spec.default_params),
+            "parameter_info": _plain(spec.parameter_info),
             "implementation_status": (
                 "Available for use"
-                if info["status"] == "available"
+                if spec.status == "available"
                 else "In development - Coming Soon"
             ),
         }
-        if "characteristics" in info:
-            details["characteristics"] = info["characteristics"]
+        if spec.characteristics is not None:
+            details["characteristics"] = _plain(spec.characteristics)
         return details
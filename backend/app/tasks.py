@@ -7,7 +7,7 @@ as per Modal best-practices for non-async callers.
 """
 
 import asyncio
-import traceback
+import logging
 from typing import Any, Dict, Optional
 
 from .celery_app import celery
@@ -15,16 +15,36 @@ from .celery_app import celery
 # Import validation for parameter warnings (unchanged)
 from .core.validation import validate_algorithm_params
 
+logger = logging.getLogger(__name__)
+
 
 # Do NOT retry ValueError — these are validation errors (bad algorithm name,
 # missing fitness function) that will fail again on every retry.
 # Only retry transient infrastructure errors (Modal cold-start failures, etc.).
 _TRANSIENT_ERRORS = (RuntimeError, ConnectionError, OSError)
 
+# Celery's thread pool (used by the embedded worker, see main.py) does not
+# enforce task_time_limit / task_soft_time_limit, so the Modal call is bounded
+# here instead. A timed-out call is treated as transient and retried.
+MODAL_CALL_TIMEOUT = celery.conf.task_soft_time_limit
+
+# Deployed Modal function, looked up on first use and shared by all tasks in
+# this worker instead of being re-resolved for every task.
+_modal_run = None
+
+
+def _get_modal_run():
+    global _modal_run
+    if _modal_run is None:
+        import modal
+        _modal_run = modal.Function.from_name("optimizehub-executor", "run_algorithm")
+    return _modal_run
+
 
 @celery.task(
     bind=True,
     acks_late=True,
+    ignore_result=False,  # streamed to clients via the result backend
     autoretry_for=_TRANSIENT_ERRORS,
     retry_backoff=True,
     retry_kwargs={"max_retries": 2},
@@ -60,11 +80,11 @@ def run_algorithm(
         # Call Modal asynchronously from this synchronous Celery task.
         # asyncio.run() is safe here because Celery workers do not run an
         # event loop by default.
-        import modal
-        _modal_run = modal.Function.from_name("optimizehub-executor", "run_algorithm")
-
         result: dict = asyncio.run(
-            _modal_run.remote.aio(algo_key, problem_payload, params)
+            asyncio.wait_for(
+                _get_modal_run().remote.aio(algo_key, problem_payload, params),
+                timeout=MODAL_CALL_TIMEOUT,
+            )
         )
 
         # Normalise result keys for frontend (same as original task)
@@ -89,5 +109,7 @@ def run_algorithm(
         # Validation error — don't retry, fail immediately with clear message
         raise RuntimeError(f"Validation error (will not retry): {exc}") from exc
     except Exception as exc:
-        tb = traceback.format_exc()
-        raise self.retry(exc=RuntimeError(f"{exc}\n{tb}")) from exc
+        # The traceback goes to the worker log (formatted only if emitted);
+        # the stored failure keeps just the exception message.
+        logger.exception("run_algorithm(%s) failed (attempt %d)", algo_key, self.request.retries + 1)
+        raise self.retry(exc=exc) from exc
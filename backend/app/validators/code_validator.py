@@ -4,25 +4,28 @@ Uses AST (Abstract Syntax Tree) analysis to detect forbidden operations.
 """
 
 import ast
-from typing import Tuple, List, Set
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import FrozenSet, Tuple, List
 
 
 class SecurityValidator:
     """Validates Python code for security violations"""
 
     # Forbidden built-in functions
-    FORBIDDEN_BUILTINS = {
+    FORBIDDEN_BUILTINS: FrozenSet[str] = frozenset({
         'eval', 'exec', 'compile', '__import__',
         'open', 'input', 'raw_input',
         'file', 'execfile', 'reload',
         'breakpoint', 'memoryview', 'bytearray'
-    }
+    })
 
     # Allowed imports only
-    ALLOWED_IMPORTS = {'math', 'numpy', 'np'}
+    ALLOWED_IMPORTS: FrozenSet[str] = frozenset({'math', 'numpy', 'np'})
 
     # Forbidden modules (even if imported)
-    FORBIDDEN_MODULES = {
+    FORBIDDEN_MODULES: FrozenSet[str] = frozenset({
         'os', 'sys', 'subprocess', 'socket', 'urllib', 'urllib2', 'urllib3',
         'http', 'httplib', 'ftplib', 'telnetlib', 'smtplib',
         'pickle', 'shelve', 'marshal', 'imp', 'importlib',
@@ -30,15 +33,15 @@ class SecurityValidator:
         'multiprocessing', 'threading', 'asyncio',
         'requests', 'flask', 'django', 'tornado',
         '__builtin__', '__builtins__', 'builtins'
-    }
+    })
 
     # Forbidden attribute access patterns
-    FORBIDDEN_ATTRIBUTES = {
+    FORBIDDEN_ATTRIBUTES: FrozenSet[str] = frozenset({
         '__code__', '__globals__', '__dict__', '__class__',
         '__bases__', '__subclasses__', '__mro__', '__loader__',
         '__spec__', '__path__', '__file__', '__name__',
         '__builtins__', '__import__'
-    }
+    })
 
     def __init__(self):
         self.errors: List[str] = []
@@ -71,12 +74,36 @@ class SecurityValidator:
         except Exception as e:
             return False, f"Failed to parse code: {str(e)}"
 
-        # Run security checks
-        self._check_imports(tree)
-        self._check_function_calls(tree)
-        self._check_attribute_access(tree)
-        self._check_forbidden_operations(tree)
-        self._check_fitness_function(tree)
+        # Run every security check in a single pass over the tree. Findings
+        # are collected per check and joined in check order, so messages read
+        # the same as when each check walked the tree separately.
+        import_errors: List[str] = []
+        call_errors: List[str] = []
+        attribute_errors: List[str] = []
+        operation_errors: List[str] = []
+        fitness_errors: List[str] = []
+        fitness_found = False
+
+        for node in ast.walk(tree):
+            if isinstance(node, (ast.Import, ast.ImportFrom)):
+                self._check_import(node, import_errors)
+            elif isinstance(node, ast.Call):
+                self._check_function_call(node, call_errors)
+            elif isinstance(node, ast.Attribute):
+                self._check_attribute_access(node, attribute_errors)
+            elif isinstance(node, ast.FunctionDef):
+                if node.name == 'fitness':
+                    fitness_found = True
+                    self._check_fitness_signature(node, fitness_errors)
+            elif isinstance(node, self._OPERATION_NODES):
+                self._check_forbidden_operation(node, operation_errors)
+
+        if not fitness_found:
+            fitness_errors.append(
+                "No 'fitness' function found. Your code must define a function named 'fitness'."
+            )
+
+        self.errors = import_errors + call_errors + attribute_errors + operation_errors + fitness_errors
 
         # Return results
         if self.errors:
@@ -84,133 +111,133 @@ class SecurityValidator:
 
         return True, ""
 
-    def _check_imports(self, tree: ast.AST):
-        """Check for forbidden imports"""
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    module_name = alias.name.split('.')[0]
-                    if module_name in self.FORBIDDEN_MODULES:
-                        self.errors.append(
-                            f"Forbidden import: '{alias.name}'. Only 'math' and 'numpy' are allowed."
-                        )
-                    elif module_name not in self.ALLOWED_IMPORTS:
-                        self.errors.append(
-                            f"Import '{alias.name}' not allowed. Only 'math' and 'numpy' are permitted."
-                        )
+    # Node types inspected by _check_forbidden_operation
+    _OPERATION_NODES = (ast.With, ast.Try, ast.Lambda, ast.ListComp, ast.DictComp, ast.SetComp)
 
-            elif isinstance(node, ast.ImportFrom):
-                module_name = node.module.split('.')[0] if node.module else ''
+    def _check_import(self, node: ast.AST, errors: List[str]):
+        """Check an import statement against the allowed and forbidden modules"""
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                module_name = alias.name.split('.')[0]
                 if module_name in self.FORBIDDEN_MODULES:
-                    self.errors.append(
-                        f"Forbidden import from '{node.module}'. Only 'math' and 'numpy' are allowed."
+                    errors.append(
+                        f"Forbidden import: '{alias.name}'. Only 'math' and 'numpy' are allowed."
                     )
-                elif module_name and module_name not in self.ALLOWED_IMPORTS:
-                    self.errors.append(
-                        f"Import from '{node.module}' not allowed. Only 'math' and 'numpy' are permitted."
+                elif module_name not in self.ALLOWED_IMPORTS:
+                    errors.append(
+                        f"Import '{alias.name}' not allowed. Only 'math' and 'numpy' are permitted."
                     )
 
-    def _check_function_calls(self, tree: ast.AST):
-        """Check for forbidden function calls"""
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                func_name = None
-
-                if isinstance(node.func, ast.Name):
-                    func_name = node.func.id
-                elif isinstance(node.func, ast.Attribute):
-                    func_name = node.func.attr
-
-                if func_name in self.FORBIDDEN_BUILTINS:
-                    self.errors.append(
-                        f"Forbidden function call: '{func_name}()'. "
-                        f"This function is not allowed for security reasons."
-                    )
+        else:
+            module_name = node.module.split('.')[0] if node.module else ''
+            if module_name in self.FORBIDDEN_MODULES:
+                errors.append(
+                    f"Forbidden import from '{node.module}'. Only 'math' and 'numpy' are allowed."
+                )
+            elif module_name and module_name not in self.ALLOWED_IMPORTS:
+                errors.append(
+                    f"Import from '{node.module}' not allowed. Only 'math' and 'numpy' are permitted."
+                )
+
+    def _check_function_call(self, node: ast.Call, errors: List[str]):
+        """Check for a forbidden function call"""
+        func_name = None
+
+        if isinstance(node.func, ast.Name):
+            func_name = node.func.id
+        elif isinstance(node.func, ast.Attribute):
+            func_name = node.func.attr
+
+        if func_name in self.FORBIDDEN_BUILTINS:
+            errors.append(
+                f"Forbidden function call: '{func_name}()'. "
+                f"This function is not allowed for security reasons."
+            )
 
-    def _check_attribute_access(self, tree: ast.AST):
+    def _check_attribute_access(self, node: ast.Attribute, errors: List[str]):
         """Check for forbidden attribute access (dunder methods)"""
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Attribute):
-                attr_name = node.attr
-                if attr_name in self.FORBIDDEN_ATTRIBUTES:
-                    self.errors.append(
-                        f"Forbidden attribute access: '{attr_name}'. "
-                        f"Special attributes are not allowed."
-                    )
+        attr_name = node.attr
+        if attr_name in self.FORBIDDEN_ATTRIBUTES:
+            errors.append(
+                f"Forbidden attribute access: '{attr_name}'. "
+                f"Special attributes are not allowed."
+            )
 
-    def _check_forbidden_operations(self, tree: ast.AST):
+    def _check_forbidden_operation(self, node: ast.AST, errors: List[str]):
         """Check for other forbidden operations"""
-        for node in ast.walk(tree):
-            # Check for file operations (with statement often used for files)
-            if isinstance(node, ast.With):
-                self.errors.append(
-                    "File operations (with statement) are not allowed."
-                )
+        # Check for file operations (with statement often used for files)
+        if isinstance(node, ast.With):
+            errors.append(
+                "File operations (with statement) are not allowed."
+            )
 
-            # Check for try/except importing (often used to detect environment)
-            if isinstance(node, ast.Try):
-                for handler in node.handlers:
-                    if handler.type and isinstance(handler.type, ast.Name):
-                        if handler.type.id == 'ImportError':
-                            self.warnings.append(
-                                "Import error handling detected - may be attempting environment detection"
-                            )
+        # Check for try/except importing (often used to detect environment)
+        elif isinstance(node, ast.Try):
+            for handler in node.handlers:
+                if handler.type and isinstance(handler.type, ast.Name):
+                    if handler.type.id == 'ImportError':
+                        self.warnings.append(
+                            "Import error handling detected - may be attempting environment detection"
+                        )
 
-            # Check for lambda (can be used for obfuscation)
-            if isinstance(node, ast.Lambda):
-                self.warnings.append(
-                    "Lambda functions detected - ensure they don't contain malicious code"
-                )
+        # Check for lambda (can be used for obfuscation)
+        elif isinstance(node, ast.Lambda):
+            self.warnings.append(
+                "Lambda functions detected - ensure they don't contain malicious code"
+            )
 
-            # Check for list/dict comprehensions with suspicious patterns
-            if isinstance(node, (ast.ListComp, ast.DictComp, ast.SetComp)):
-                for generator in node.generators:
-                    if isinstance(generator.iter, ast.Call):
-                        if isinstance(generator.iter.func, ast.Name):
-                            if generator.iter.func.id in self.FORBIDDEN_BUILTINS:
-                                self.errors.append(
-                                    f"Forbidden function in comprehension: {generator.iter.func.id}"
-                                )
-
-    def _check_fitness_function(self, tree: ast.AST):
-        """Verify that a 'fitness' function exists and has correct signature"""
-        fitness_found = False
-        fitness_params_correct = False
+        # Check for list/dict comprehensions with suspicious patterns
+        else:
+            for generator in node.generators:
+                if isinstance(generator.iter, ast.Call):
+                    if isinstance(generator.iter.func, ast.Name):
+                        if generator.iter.func.id in self.FORBIDDEN_BUILTINS:
+                            errors.append(
+                                f"Forbidden function in comprehension: {generator.iter.func.id}"
+                            )
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                if node.name == 'fitness':
-                    fitness_found = True
+    def _check_fitness_signature(self, node: ast.FunctionDef, errors: List[str]):
+        """Verify that a 'fitness' function has the correct signature"""
+        if len(node.args.args) != 1:
+            errors.append(
+                "Fitness function must accept exactly one parameter (e.g., 'def fitness(x):')."
+            )
 
-                    # Check function signature
-                    if len(node.args.args) == 1:
-                        fitness_params_correct = True
-                    else:
-                        self.errors.append(
-                            "Fitness function must accept exactly one parameter (e.g., 'def fitness(x):')."
-                        )
 
-        if not fitness_found:
-            self.errors.append(
-                "No 'fitness' function found. Your code must define a function named 'fitness'."
-            )
-        elif not fitness_params_correct:
-            # Error already added above
-            pass
+# Validation results for recently seen code, keyed by a digest of the source so
+# the cache does not hold on to uploads (up to 1 MB each) themselves.
+_VALIDATION_CACHE_SIZE = 1024
+_validation_cache: "OrderedDict[bytes, Tuple[bool, str]]" = OrderedDict()
+_validation_cache_lock = threading.Lock()
 
 
 def validate_fitness_code(code: str) -> Tuple[bool, str]:
     """
     Convenience function to validate fitness function code.
 
+    Validation is deterministic, so resubmitting identical code (common while
+    tuning parameters) reuses the earlier result instead of re-parsing it.
+
     Args:
         code: Python source code as string
 
     Returns:
         Tuple of (is_valid, error_message)
     """
-    validator = SecurityValidator()
-    return validator.validate(code)
+    key = hashlib.blake2b(code.encode(), digest_size=16).digest()
+    with _validation_cache_lock:
+        result = _validation_cache.get(key)
+        if result is not None:
+            _validation_cache.move_to_end(key)
+            return result
+
+    result = SecurityValidator().validate(code)
+
+    with _validation_cache_lock:
+        _validation_cache[key] = result
+        if len(_validation_cache) > _VALIDATION_CACHE_SIZE:
+            _validation_cache.popitem(last=False)
+    return result
 
 
 # Example usage and testing
@@ -35,11 +35,27 @@ image = (
     .add_local_python_source("app", copy=True)
 )
 
+# Import the algorithm and fitness modules once when a container boots, so the
+# first run in a fresh container doesn't spend its 30 s budget on imports.
+# The executor functions enable memory snapshots, so after the first boot new
+# containers are restored with these modules already loaded.
+with image.imports():
+    import numpy  # noqa: F401
+    import app.algorithms  # noqa: F401
+    import app.algorithms.simulated_annealing  # noqa: F401
+    import app.core.utils  # noqa: F401
+    import app.core.real_world_problems  # noqa: F401
+
 # ---------------------------------------------------------------------------
 # Modal app
 # ---------------------------------------------------------------------------
 app = modal.App("optimizehub-executor", image=image)
 
+# Idle containers stay up this long (Modal's default is 60 s) so back-to-back
+# runs land on a warm container with the interpreter and algorithm modules
+# already loaded, instead of paying a fresh container start each time.
+SCALEDOWN_WINDOW = 300
+
 # ---------------------------------------------------------------------------
 # Algorithm name mapping
 # Supports all naming conventions used across the codebase:
@@ -90,6 +106,29 @@ def _serialize_result(result: dict) -> dict:
     return {k: _serialize(v) for k, v in result.items()}
 
 
+# Algorithm classes already resolved in this container, by canonical name
+_ALGO_CLASSES: dict = {}
+
+
+def _resolve_algorithm_class(canonical: str):
+    """
+    Look up the algorithm class named by the registry entry for ``canonical``.
+
+    The registry records each class's module and name, so the class is fetched
+    directly (importing its module on first use) instead of by scanning the
+    module's members, and cached for later runs in the same container.
+    """
+    algo_class = _ALGO_CLASSES.get(canonical)
+    if algo_class is None:
+        import importlib
+        from app.config import get_algorithm_info
+
+        spec = get_algorithm_info(canonical)
+        algo_class = getattr(importlib.import_module(spec.module), spec.class_name)
+        _ALGO_CLASSES[canonical] = algo_class
+    return algo_class
+
+
 # ---------------------------------------------------------------------------
 # Function 1 — Standard run and YAML/JSON config run
 # ---------------------------------------------------------------------------
@@ -98,6 +137,8 @@ def _serialize_result(result: dict) -> dict:
     memory=512,          # matches Docker 512 MB memory limit
     block_network=True,  # matches Docker --network none
     cpu=1.0,
+    scaledown_window=SCALEDOWN_WINDOW,
+    enable_memory_snapshot=True,
 )
 def run_algorithm(
     algorithm_name: str,
@@ -137,8 +178,6 @@ def run_algorithm(
                     function / problem config is invalid.
     """
     import time
-    import importlib
-    import inspect
 
     start_time = time.time()
 
@@ -150,25 +189,7 @@ def run_algorithm(
             f"Valid names: {sorted(ALGO_NAME_MAP.keys())}"
         )
 
-    # Import algorithm class inside the function body (not at module level)
-    module = importlib.import_module(f"app.algorithms.{canonical}")
-
-    from app.algorithms.base import OptimizationAlgorithm
-
-    algo_class = None
-    for _, obj in inspect.getmembers(module, inspect.isclass):
-        if (
-            obj.__module__ == module.__name__
-            and issubclass(obj, OptimizationAlgorithm)
-            and obj is not OptimizationAlgorithm
-        ):
-            algo_class = obj
-            break
-
-    if algo_class is None:
-        raise ValueError(
-            f"No OptimizationAlgorithm subclass found in app.algorithms.{canonical}"
-        )
+    algo_class = _resolve_algorithm_class(canonical)
 
     # ── 2. Build problem_dict with a callable fitness_function ────────────────
     problem_dict = dict(problem_config)
@@ -195,7 +216,8 @@ def run_algorithm(
         problem_dict["fitness_function"] = create_knapsack_fitness(
             weights, values, capacity
         )
-        problem_dict.setdefault("bounds", [(0, 1)] * len(items))
+        if not problem_dict.get("bounds"):
+            problem_dict["bounds"] = [(0, 1)] * len(items)
         problem_dict.setdefault("dimensions", len(items))
 
     elif problem_type == "tsp":
@@ -206,8 +228,13 @@ def run_algorithm(
             raise ValueError("TSP problem requires at least 3 cities")
 
         city_coords = [(c["x"], c["y"]) for c in cities]
-        problem_dict["fitness_function"] = create_tsp_fitness(city_coords)
-        problem_dict.setdefault("bounds", [(0, 1)] * len(cities))
+        # The GA evolves tours as permutations directly; the other algorithms
+        # search random keys that are ranked into a tour.
+        encoding = "permutation" if canonical == "genetic_algorithm" else "random_key"
+        problem_dict["encoding"] = encoding
+        problem_dict["fitness_function"] = create_tsp_fitness(city_coords, encoding)
+        if not problem_dict.get("bounds"):
+            problem_dict["bounds"] = [(0, 1)] * len(cities)
         problem_dict.setdefault("dimensions", len(cities))
 
     else:
@@ -234,7 +261,7 @@ def run_algorithm(
     # ── 3. Merge params: registry defaults + caller overrides ─────────────────
     try:
         from app.config import get_algorithm_info
-        default_params = get_algorithm_info(canonical).get("default_params", {}).copy()
+        default_params = dict(get_algorithm_info(canonical).default_params)
         default_params.update(params)
         merged_params = default_params
     except Exception:
@@ -261,6 +288,8 @@ def run_algorithm(
     memory=512,          # matches Docker 512 MB memory limit
     block_network=True,  # matches Docker --network none
     cpu=1.0,
+    scaledown_window=SCALEDOWN_WINDOW,
+    enable_memory_snapshot=True,
 )
 def run_with_custom_fitness(
     algorithm_name: str,
@@ -303,8 +332,6 @@ def run_with_custom_fitness(
                     RestrictedPython compilation.
     """
     import time
-    import importlib
-    import inspect
 
     from RestrictedPython import compile_restricted
 
@@ -318,25 +345,7 @@ def run_with_custom_fitness(
             f"Valid names: {sorted(ALGO_NAME_MAP.keys())}"
         )
 
-    # Import algorithm class inside the function body (not at module level)
-    module = importlib.import_module(f"app.algorithms.{canonical}")
-
-    from app.algorithms.base import OptimizationAlgorithm
-
-    algo_class = None
-    for _, obj in inspect.getmembers(module, inspect.isclass):
-        if (
-            obj.__module__ == module.__name__
-            and issubclass(obj, OptimizationAlgorithm)
-            and obj is not OptimizationAlgorithm
-        ):
-            algo_class = obj
-            break
-
-    if algo_class is None:
-        raise ValueError(
-            f"No OptimizationAlgorithm subclass found in app.algorithms.{canonical}"
-        )
+    algo_class = _resolve_algorithm_class(canonical)
 
     # ── 2. Validate + execute user code safely ────────────────────────────────
     # Strategy:
@@ -0,0 +1,49 @@
+"""
+Shared pytest fixtures.
+
+Unit tests run against an in-memory fake Redis (fakeredis) standing in for
+both the Celery result backend and the asyncio pool used by the API; the
+integration scripts alongside them still talk to the real services.
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+# Ensure the backend package root is on the path when running from any directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Load backend/.env before any test module imports app.celery_app
+from dotenv import load_dotenv
+load_dotenv(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".env"))
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    """
+    Point the Celery result backend and the API's asyncio Redis clients at
+    one shared fakeredis server.
+
+    Yields a namespace with ``backend`` (a RedisBackend), ``client`` (its
+    sync fake client) and ``aclient`` (the asyncio fake client).
+    """
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")  # Lua scripting (EVAL) support
+    from celery.backends.redis import RedisBackend
+
+    from app.api import async_tasks, sse
+    from app.celery_app import celery
+
+    server = fakeredis.FakeServer()
+    backend = RedisBackend(app=celery, url="rediss://localhost:6379/0")
+    backend.client = fakeredis.FakeRedis(server=server)
+    aclient = fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+
+    monkeypatch.setattr(type(celery), "backend", property(lambda app: backend))
+    monkeypatch.setattr(async_tasks, "_redis", aclient)
+    monkeypatch.setattr(sse, "_redis", aclient)
+    monkeypatch.setattr(sse, "_watchers", {})
+
+    yield SimpleNamespace(backend=backend, client=backend.client, aclient=aclient)
@@ -0,0 +1,234 @@
+"""
+Unit tests for the async task API: submission dedupe, the bulk status
+endpoint and result payload normalization.
+
+Redis is faked (see the ``fake_redis`` fixture in conftest.py), so these
+run without a broker or result backend:
+
+    python -m pytest tests/test_async_tasks.py -v
+"""
+
+import asyncio
+import copy
+from types import SimpleNamespace
+
+import orjson
+import pytest
+from fastapi import HTTPException
+
+from app.api import async_tasks
+from app.celery_app import claim_task_id, release_task_id
+
+PROBLEM = {"dimensions": 2, "bounds": [[-5, 5], [-5, 5]], "fitness_function_name": "sphere"}
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+class _FakeGroup:
+    """Stand-in for celery.group that records what would have been queued."""
+
+    def __init__(self, calls, fail=False):
+        self.calls = calls
+        self.fail = fail
+
+    def __call__(self, sigs):
+        self.sigs = list(sigs)
+        return self
+
+    def apply_async(self):
+        if self.fail:
+            raise ConnectionError("broker unreachable")
+        self.calls.append([sig.options["task_id"] for sig in self.sigs])
+        return SimpleNamespace(id="group-id")
+
+
+def _submit(monkeypatch, algorithms, fail=False):
+    calls = []
+    monkeypatch.setattr(async_tasks, "group", _FakeGroup(calls, fail=fail))
+    request = async_tasks.ProblemRequest(problem=dict(PROBLEM), algorithms=algorithms)
+    return async_tasks.optimize(request), calls
+
+
+def _store_meta(fake_redis, task_id, status, result=None):
+    if status in ("FAILURE", "REVOKED") and result is None:
+        result = RuntimeError(status.lower())
+    fake_redis.backend.store_result(task_id, result, status)
+
+
+# ---------------------------------------------------------------------------
+# Dedupe (claim_task_id / optimize)
+# ---------------------------------------------------------------------------
+
+def test_identical_submission_reuses_task_id(fake_redis):
+    first_id, first_new = claim_task_id("pso", PROBLEM, {})
+    second_id, second_new = claim_task_id("pso", PROBLEM, {})
+
+    assert first_new and not second_new
+    assert second_id == first_id
+    assert claim_task_id("genetic", PROBLEM, {})[0] != first_id
+
+
+@pytest.mark.parametrize("state", ["FAILURE", "REVOKED"])
+def test_failed_submission_is_not_reused(fake_redis, state):
+    old_id, _ = claim_task_id("pso", PROBLEM, {})
+    _store_meta(fake_redis, old_id, state)
+
+    new_id, is_new = claim_task_id("pso", PROBLEM, {})
+
+    assert is_new and new_id != old_id
+    assert claim_task_id("pso", PROBLEM, {}) == (new_id, False)
+
+
+def test_concurrent_replacement_of_failed_id_enqueues_once(fake_redis, monkeypatch):
+    old_id, _ = claim_task_id("pso", PROBLEM, {})
+    _store_meta(fake_redis, old_id, "FAILURE")
+
+    # Let a competing submission replace the failed id between our state
+    # check and our own replacement.
+    real_get_state = fake_redis.backend.get_state
+    competitor = {}
+
+    def get_state(task_id):
+        state = real_get_state(task_id)
+        if "claim" not in competitor:
+            competitor["claim"] = None
+            competitor["claim"] = claim_task_id("pso", PROBLEM, {})
+        return state
+
+    monkeypatch.setattr(fake_redis.backend, "get_state", get_state)
+    task_id, is_new = claim_task_id("pso", PROBLEM, {})
+
+    competitor_id, competitor_new = competitor["claim"]
+    assert competitor_new
+    assert (task_id, is_new) == (competitor_id, False)
+
+
+def test_optimize_queues_only_new_tasks(fake_redis, monkeypatch):
+    first, calls = _submit(monkeypatch, ["pso", "genetic"])
+    assert calls == [first["task_ids"]]
+
+    second, calls = _submit(monkeypatch, ["pso", "genetic"])
+    assert second == {"group_id": None, "task_ids": first["task_ids"]}
+    assert calls == []
+
+
+def test_optimize_releases_claims_when_enqueue_fails(fake_redis, monkeypatch):
+    with pytest.raises(HTTPException) as exc_info:
+        _submit(monkeypatch, ["pso"], fail=True)
+    assert exc_info.value.status_code == 503
+
+    # The resubmission must be queued, not pointed at the never-queued id
+    response, calls = _submit(monkeypatch, ["pso"])
+    assert calls == [response["task_ids"]]
+
+
+def test_release_only_drops_its_own_claim(fake_redis):
+    task_id, _ = claim_task_id("pso", PROBLEM, {})
+
+    release_task_id("some-other-id", "pso", PROBLEM, {})
+    assert claim_task_id("pso", PROBLEM, {}) == (task_id, False)
+
+    release_task_id(task_id, "pso", PROBLEM, {})
+    assert claim_task_id("pso", PROBLEM, {})[1]
+
+
+# ---------------------------------------------------------------------------
+# Bulk status endpoint
+# ---------------------------------------------------------------------------
+
+def test_bulk_status_in_request_order(fake_redis):
+    _store_meta(fake_redis, "done", "SUCCESS", {
+        "status": "SUCCESS",
+        "result": {"algorithm": "PSO", "convergence_curve": [3.0, 1.0], "execution_time": 0.5},
+    })
+    _store_meta(fake_redis, "broken", "FAILURE", RuntimeError("boom"))
+
+    request = async_tasks.TaskStatusRequest(task_ids=["missing", "done", "broken"])
+    response = asyncio.run(async_tasks.get_tasks_status(request))
+    body = orjson.loads(response.body)
+
+    assert [s["task_id"] for s in body] == ["missing", "done", "broken"]
+    assert [s["state"] for s in body] == ["PENDING", "SUCCESS", "FAILURE"]
+    assert body[1]["result"]["best_fitness"] == 1.0
+    assert body[1]["result"]["status"] == "SUCCESS"
+    assert body[2]["result"] == "boom"
+
+
+def test_bulk_status_caps_task_ids(fake_redis):
+    request = async_tasks.TaskStatusRequest(
+        task_ids=[f"id-{i}" for i in range(async_tasks.MAX_BULK_TASK_IDS + 1)]
+    )
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(async_tasks.get_tasks_status(request))
+    assert exc_info.value.status_code == 400
+
+    request.task_ids.pop()
+    response = asyncio.run(async_tasks.get_tasks_status(request))
+    assert len(orjson.loads(response.body)) == async_tasks.MAX_BULK_TASK_IDS
+
+
+def test_bulk_status_without_result_backend(monkeypatch):
+    monkeypatch.setattr(async_tasks, "_redis", None)
+    request = async_tasks.TaskStatusRequest(task_ids=["a"])
+
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(async_tasks.get_tasks_status(request))
+    assert exc_info.value.status_code == 503
+    assert exc_info.value.detail["error"] == "Task queue unavailable"
+
+
+# ---------------------------------------------------------------------------
+# Result normalization
+# ---------------------------------------------------------------------------
+
+def test_normalize_canonical_payload_keeps_status_and_input():
+    payload = {
+        "algo": "pso",
+        "status": "SUCCESS",
+        "result": {
+            "algorithm_display": "PSO",
+            "iterations_completed": 2,
+            "execution_time": 0.5,
+            "best_fitness": 1.0,
+        },
+    }
+    original = copy.deepcopy(payload)
+
+    normalized = async_tasks._normalize_result_payload(payload)
+
+    assert normalized["status"] == "SUCCESS"
+    assert normalized["best_fitness"] == 1.0
+    assert payload == original
+
+
+def test_normalize_legacy_payload_leaves_input_untouched():
+    payload = {"status": "SUCCESS", "result": {"algorithm": "DE/rand/1/bin (F=0.5)", "history": [2.0, 1.5]}}
+    original = copy.deepcopy(payload)
+
+    normalized = async_tasks._normalize_result_payload(payload)
+
+    assert normalized["algorithm_display"] == "DE/rand/1/bin (F=0.5)"
+    assert normalized["iterations_completed"] == 2
+    assert normalized["best_fitness"] == 1.5
+    assert normalized["status"] == "SUCCESS"
+    assert payload == original
+
+
+def test_normalize_copies_only_when_writing():
+    canonical = {
+        "status": "SUCCESS",
+        "algorithm_display": "PSO",
+        "iterations_completed": 2,
+        "execution_time": 0.5,
+        "best_fitness": 1.0,
+    }
+    assert async_tasks._normalize_result_payload(canonical) is canonical
+
+    nested = {"status": "SUCCESS", "result": dict(canonical, status="STALE")}
+    assert async_tasks._normalize_result_payload(nested) is nested["result"]
+
+    legacy = {"algorithm": "PSO", "history": [1.0]}
+    normalized = async_tasks._normalize_result_payload(legacy)
+    assert normalized is not legacy and "best_fitness" not in legacy
@@ -0,0 +1,83 @@
+"""
+Unit tests checking that every vectorized ``fitness.batch`` matches its
+scalar fitness function row by row.
+
+    python -m pytest tests/test_batch_fitness.py -v
+"""
+
+import numpy as np
+import pytest
+
+from app.core.real_world_problems import (
+    create_knapsack_fitness,
+    create_portfolio_fitness,
+    create_tsp_fitness,
+    get_problem_example,
+)
+from app.core.utils import FITNESS_FUNCTIONS
+
+CITIES = get_problem_example('tsp')['example_params']['cities']
+KNAPSACK = get_problem_example('knapsack')['example_params']
+
+
+def _tsp_random_key(rng):
+    return create_tsp_fitness(CITIES), rng.uniform(0, 1, (32, len(CITIES)))
+
+
+def _tsp_permutation(rng):
+    population = np.array([rng.permutation(len(CITIES)) for _ in range(32)])
+    return create_tsp_fitness(CITIES, encoding='permutation'), population
+
+
+def _knapsack(rng):
+    # Mix of feasible and over-capacity selections
+    fitness = create_knapsack_fitness(**KNAPSACK)
+    return fitness, rng.uniform(0, 1, (64, len(KNAPSACK['weights'])))
+
+
+def _portfolio(rng):
+    returns = np.array([0.05, 0.07, 0.12, 0.03])
+    covariance = np.diag([0.01, 0.02, 0.03, 0.005]) + 0.001
+    population = rng.uniform(-1, 1, (32, len(returns)))
+    population[0] = 0.0  # all-zero weights fall back to an equal split
+    return create_portfolio_fitness(returns, covariance), population
+
+
+REAL_WORLD_CASES = {
+    'tsp_random_key': _tsp_random_key,
+    'tsp_permutation': _tsp_permutation,
+    'knapsack': _knapsack,
+    'portfolio': _portfolio,
+}
+
+
+@pytest.mark.parametrize('name', sorted(FITNESS_FUNCTIONS))
+@pytest.mark.parametrize('dimensions', [1, 2, 10])
+def test_benchmark_batch_matches_scalar(name, dimensions):
+    fitness = FITNESS_FUNCTIONS[name]
+    if not hasattr(fitness, 'batch'):
+        pytest.skip(f"{name} has no batched form")
+
+    population = np.random.default_rng(0).uniform(-5, 5, (32, dimensions))
+
+    batched = fitness.batch(population)
+
+    assert batched.shape == (len(population),)
+    np.testing.assert_allclose(batched, [fitness(x) for x in population], rtol=1e-12, atol=1e-12)
+
+
+@pytest.mark.parametrize('case', sorted(REAL_WORLD_CASES))
+def test_real_world_batch_matches_scalar(case):
+    fitness, population = REAL_WORLD_CASES[case](np.random.default_rng(0))
+
+    batched = fitness.batch(population)
+
+    assert batched.shape == (len(population),)
+    # TSP distances are stored as float32; the rest are exact
+    np.testing.assert_allclose(batched, [fitness(x) for x in population], rtol=1e-6)
+
+
+def test_portfolio_accepts_integer_solutions():
+    fitness = create_portfolio_fitness(np.array([0.05, 0.07]), np.eye(2) * 0.01)
+
+    assert fitness(np.array([1, 3])) == pytest.approx(fitness(np.array([1.0, 3.0])))
@@ -0,0 +1,168 @@
+"""
+Unit tests for the fitness-code security validator: the combined error
+order of the single AST pass, and the digest-keyed result cache.
+
+    python -m pytest tests/test_code_validator.py -v
+"""
+
+import hashlib
+from collections import OrderedDict
+
+import pytest
+
+from app.validators import code_validator
+from app.validators.code_validator import SecurityValidator, validate_fitness_code
+
+# Snippets exercising every check. Each error list is what the original
+# implementation (one ast.walk per check, run in the order imports, calls,
+# attributes, operations, fitness) reported, so the single-pass rewrite
+# must reproduce it exactly. Within a check, findings follow ast.walk's
+# breadth-first order.
+ORDERED_CASES = [
+    (
+        """
+def fitness(x):
+    with open('f') as fh:
+        pass
+    y = x.__class__
+    import os
+    return eval('1')
+""",
+        [
+            "Forbidden import: 'os'. Only 'math' and 'numpy' are allowed.",
+            "Forbidden function call: 'eval()'. This function is not allowed for security reasons.",
+            "Forbidden function call: 'open()'. This function is not allowed for security reasons.",
+            "Forbidden attribute access: '__class__'. Special attributes are not allowed.",
+            "File operations (with statement) are not allowed.",
+        ],
+    ),
+    (
+        """
+import json
+from subprocess import run
+from collections import deque
+
+def helper(a, b):
+    return [c for c in compile('1', 'x', 'eval')]
+
+def fitness(x, y):
+    return x.__dict__
+""",
+        [
+            "Import 'json' not allowed. Only 'math' and 'numpy' are permitted.",
+            "Forbidden import from 'subprocess'. Only 'math' and 'numpy' are allowed.",
+            "Import from 'collections' not allowed. Only 'math' and 'numpy' are permitted.",
+            "Forbidden function call: 'compile()'. This function is not allowed for security reasons.",
+            "Forbidden attribute access: '__dict__'. Special attributes are not allowed.",
+            "Forbidden function in comprehension: compile",
+            "Fitness function must accept exactly one parameter (e.g., 'def fitness(x):').",
+        ],
+    ),
+    (
+        """
+import os, sys
+x = {k: 1 for k in open('f')}
+with a:
+    with b:
+        pass
+""",
+        [
+            "Forbidden import: 'os'. Only 'math' and 'numpy' are allowed.",
+            "Forbidden import: 'sys'. Only 'math' and 'numpy' are allowed.",
+            "Forbidden function call: 'open()'. This function is not allowed for security reasons.",
+            "File operations (with statement) are not allowed.",
+            "Forbidden function in comprehension: open",
+            "File operations (with statement) are not allowed.",
+            "No 'fitness' function found. Your code must define a function named 'fitness'.",
+        ],
+    ),
+]
+
+VALID_CODE = """
+import numpy as np
+
+def fitness(x):
+    return float(np.sum(x ** 2))
+"""
+
+
+@pytest.fixture
+def empty_cache(monkeypatch):
+    """Run with an empty validation cache, restoring the shared one afterwards."""
+    cache = OrderedDict()
+    monkeypatch.setattr(code_validator, "_validation_cache", cache)
+    return cache
+
+
+# ---------------------------------------------------------------------------
+# Error order
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("code, expected_errors", ORDERED_CASES)
+def test_errors_reported_in_check_order(code, expected_errors):
+    validator = SecurityValidator()
+
+    is_valid, message = validator.validate(code)
+
+    assert not is_valid
+    assert validator.errors == expected_errors
+    assert message == " | ".join(expected_errors)
+
+
+def test_warnings_reported_in_tree_order():
+    code = """
+def fitness(x):
+    f = lambda v: v
+    try:
+        pass
+    except ImportError:
+        pass
+    return f(x)
+"""
+    validator = SecurityValidator()
+
+    assert validator.validate(code) == (True, "")
+    assert validator.warnings == [
+        "Import error handling detected - may be attempting environment detection",
+        "Lambda functions detected - ensure they don't contain malicious code",
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Result cache
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize(
+    "code",
+    [VALID_CODE, "", "def fitness(x:\n", *(code for code, _ in ORDERED_CASES)],
+)
+def test_cached_result_matches_fresh_validation(code, empty_cache, monkeypatch):
+    fresh = SecurityValidator().validate(code)
+
+    assert validate_fitness_code(code) == fresh
+
+    # The second call must be served from the cache
+    def fail(self, code):
+        raise AssertionError("validated again instead of using the cache")
+
+    monkeypatch.setattr(SecurityValidator, "validate", fail)
+    assert validate_fitness_code(code) == fresh
+
+
+def test_cache_evicts_least_recently_used(empty_cache):
+    size = code_validator._VALIDATION_CACHE_SIZE
+    assert size == 1024
+    snippets = [f"def fitness(x):\n    return x + {i}\n" for i in range(size + 1)]
+
+    for code in snippets[:size]:
+        validate_fitness_code(code)
+    assert len(empty_cache) == size
+
+    # Touch the oldest entry so the second-oldest is evicted instead
+    validate_fitness_code(snippets[0])
+    validate_fitness_code(snippets[size])
+
+    assert len(empty_cache) == size
+    keys = [hashlib.blake2b(code.encode(), digest_size=16).digest() for code in snippets[:2]]
+    assert keys[0] in empty_cache
+    assert keys[1] not in empty_cache
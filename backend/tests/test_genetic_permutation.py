@@ -0,0 +1,74 @@
+"""
+Unit tests for the genetic algorithm's permutation encoding (TSP tours):
+ordered crossover and swap mutation must always yield valid permutations,
+and reported solutions must decode back to the evolved tour.
+
+    python -m pytest tests/test_genetic_permutation.py -v
+"""
+
+import numpy as np
+import pytest
+
+from app.algorithms.genetic_algorithm import GeneticAlgorithm
+from app.core.real_world_problems import create_tsp_fitness, get_problem_example
+
+CITIES = get_problem_example('tsp')['example_params']['cities']
+
+
+def _tsp_ga(n_cities=None, **params):
+    cities = CITIES if n_cities is None else [(np.cos(i), np.sin(i)) for i in range(n_cities)]
+    problem = {
+        'dimensions': len(cities),
+        'bounds': [(0.0, 1.0)] * len(cities),
+        'fitness_function': create_tsp_fitness(cities, encoding='permutation'),
+        'encoding': 'permutation',
+    }
+    return GeneticAlgorithm(problem, {'population_size': 20, 'max_iterations': 15, **params})
+
+
+def _assert_permutation(individual, n):
+    assert sorted(individual.tolist()) == list(range(n))
+
+
+@pytest.mark.parametrize('n_cities', [2, 3, 8, 25])
+@pytest.mark.parametrize('seed', range(5))
+def test_ordered_crossover_yields_permutations(n_cities, seed):
+    np.random.seed(seed)
+    ga = _tsp_ga(n_cities)
+
+    for _ in range(50):
+        parent1, parent2 = np.random.permutation(n_cities), np.random.permutation(n_cities)
+        child = ga._ordered_crossover(parent1, parent2)
+        _assert_permutation(child, n_cities)
+
+
+@pytest.mark.parametrize('mutation_rate', [0.0, 0.3, 1.0])
+def test_swap_mutation_yields_permutations(mutation_rate):
+    np.random.seed(0)
+    ga = _tsp_ga(10, mutation_rate=mutation_rate)
+    parent = np.random.permutation(10)
+
+    for _ in range(50):
+        child = ga._swap_mutation(parent)
+        _assert_permutation(child, 10)
+    _assert_permutation(parent, 10)  # parent is not modified in place
+
+    if mutation_rate == 0.0:
+        np.testing.assert_array_equal(ga._swap_mutation(parent), parent)
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_run_keeps_population_valid_and_solution_decodable(seed):
+    np.random.seed(seed)
+    ga = _tsp_ga()
+    ga.initialize()
+    ga.optimize()
+
+    for individual in ga.population:
+        _assert_permutation(individual, len(CITIES))
+
+    # best_solution is in random-key form: its argsort is the best tour
+    tour = np.argsort(ga.best_solution)
+    np.testing.assert_array_equal(tour, ga.best_individual)
+    assert ga.fitness_function(tour) == pytest.approx(ga.best_fitness)
+    assert ga.convergence_curve == sorted(ga.convergence_curve, reverse=True)
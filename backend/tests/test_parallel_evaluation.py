@@ -0,0 +1,101 @@
+"""
+Unit tests for thread-pool population evaluation (evaluate_population and
+the GA's ``parallel`` option): concurrent scores must match sequential ones
+for the built-in fitness factories, and non-thread-safe functions are refused.
+
+    python -m pytest tests/test_parallel_evaluation.py -v
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from app.algorithms.genetic_algorithm import GeneticAlgorithm
+from app.core.real_world_problems import (
+    create_feature_selection_fitness,
+    create_knapsack_fitness,
+    create_scheduling_fitness,
+    create_tsp_fitness,
+    get_problem_example,
+)
+from app.core.utils import evaluate_population
+
+
+def _reads_x_twice(X, y):
+    """Evaluator that reads its input twice; any concurrent overwrite shows up."""
+    first = float(X.sum())
+    time.sleep(0.001)  # give other threads a chance to run in between
+    return first + float(X.sum())
+
+
+def _feature_selection(rng):
+    X = rng.normal(size=(500, 30))
+    y = rng.normal(size=500)
+    return create_feature_selection_fitness(X, y, _reads_x_twice), rng.uniform(0, 1, (64, 30))
+
+
+def _tsp(rng):
+    cities = rng.uniform(0, 10, (12, 2)).tolist()
+    return create_tsp_fitness(cities), rng.uniform(0, 1, (64, 12))
+
+
+def _knapsack(rng):
+    params = get_problem_example('knapsack')['example_params']
+    return create_knapsack_fitness(**params), rng.uniform(0, 1, (64, len(params['weights'])))
+
+
+def _scheduling(rng):
+    fitness = create_scheduling_fitness(rng.uniform(1, 5, 10).tolist(), n_machines=3)
+    return fitness, rng.uniform(0, 1, (64, 10))
+
+
+CASES = {
+    'feature_selection': _feature_selection,
+    'tsp': _tsp,
+    'knapsack': _knapsack,
+    'scheduling': _scheduling,
+}
+
+
+@pytest.mark.parametrize('case', sorted(CASES))
+def test_parallel_matches_sequential(case):
+    fitness, population = CASES[case](np.random.default_rng(0))
+
+    sequential = np.array([fitness(x) for x in population])
+    parallel = evaluate_population(fitness, population, n_jobs=8)
+
+    np.testing.assert_array_equal(parallel, sequential)
+
+
+def test_ga_parallel_matches_sequential_for_feature_selection():
+    fitness, population = _feature_selection(np.random.default_rng(1))
+    problem = {
+        'dimensions': population.shape[1],
+        'bounds': [(0.0, 1.0)] * population.shape[1],
+        'fitness_function': fitness,
+    }
+
+    sequential = GeneticAlgorithm(problem, {'parallel': False})._evaluate_population(population)
+    parallel = GeneticAlgorithm(problem, {'parallel': True})._evaluate_population(population)
+
+    np.testing.assert_array_equal(parallel, sequential)
+
+
+def test_non_thread_safe_fitness_is_refused():
+    calls = []
+
+    def stateful_fitness(x):
+        calls.append(x)
+        return float(len(calls))
+
+    stateful_fitness.thread_safe = False
+    problem = {'dimensions': 2, 'bounds': [(-1.0, 1.0)] * 2, 'fitness_function': stateful_fitness}
+
+    with pytest.raises(ValueError, match="thread-safe"):
+        evaluate_population(stateful_fitness, np.zeros((4, 2)))
+    with pytest.raises(ValueError, match="thread-safe"):
+        GeneticAlgorithm(problem, {'parallel': True})
+
+    # Sequential evaluation is still allowed
+    GeneticAlgorithm(problem, {'parallel': False})
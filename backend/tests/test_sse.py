@@ -0,0 +1,147 @@
+"""
+Unit tests for the SSE task stream: shared per-task watchers, the result
+listener, keepalive and lifetime frames.
+
+Redis is faked (see the ``fake_redis`` fixture in conftest.py):
+
+    python -m pytest tests/test_sse.py -v
+"""
+
+import asyncio
+
+import orjson
+import pytest
+
+from app.api import sse
+
+KEEPALIVE = b": keepalive\n\n"
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _decode(frame: bytes) -> dict:
+    assert frame.startswith(b"data: ") and frame.endswith(b"\n\n")
+    return orjson.loads(frame[len(b"data: "):])
+
+
+async def _collect(task_id: str, timeout: float = 2.0) -> list:
+    response = await sse.stream_task_status(task_id)
+
+    async def drain():
+        return [chunk async for chunk in response.body_iterator]
+
+    return await asyncio.wait_for(drain(), timeout)
+
+
+# ---------------------------------------------------------------------------
+# Watcher sharing and cleanup
+# ---------------------------------------------------------------------------
+
+def test_watcher_shared_and_released(fake_redis):
+    async def scenario():
+        first = sse._acquire_watcher("task-1")
+        second = sse._acquire_watcher("task-1")
+        assert first is second and first.refcount == 2
+
+        sse._release_watcher(first)
+        assert sse._watchers["task-1"] is first
+
+        sse._release_watcher(second)
+        await asyncio.sleep(0)
+        assert "task-1" not in sse._watchers
+        assert first._task.done()
+
+    asyncio.run(scenario())
+
+
+def test_failed_watcher_replaced_without_dropping_successor(fake_redis):
+    async def scenario():
+        broken = sse._acquire_watcher("task-1")
+        await broken._task
+        broken.error = ConnectionError("lost")
+
+        fresh = sse._acquire_watcher("task-1")
+        assert fresh is not broken
+
+        # Releasing the stale watcher must not unregister its replacement
+        sse._release_watcher(broken)
+        assert sse._watchers["task-1"] is fresh
+        sse._release_watcher(fresh)
+        assert sse._watchers == {}
+
+    asyncio.run(scenario())
+
+
+# ---------------------------------------------------------------------------
+# Streams
+# ---------------------------------------------------------------------------
+
+def test_stream_ends_on_stored_success(fake_redis):
+    fake_redis.backend.store_result("task-1", {"status": "SUCCESS", "result": {"best_fitness": 0.5}}, "SUCCESS")
+
+    frames = asyncio.run(_collect("task-1"))
+
+    assert len(frames) == 1
+    event = _decode(frames[0])
+    assert event["state"] == "SUCCESS"
+    assert event["result"]["best_fitness"] == 0.5
+    assert event["result"]["status"] == "SUCCESS"
+    assert sse._watchers == {}
+
+
+def test_stream_keepalive_then_lifetime_frame(fake_redis, monkeypatch):
+    monkeypatch.setattr(sse, "SSE_KEEPALIVE_INTERVAL", 0.01)
+    monkeypatch.setattr(sse, "SSE_MAX_LIFETIME", 0.05)
+
+    frames = asyncio.run(_collect("task-1"))
+
+    assert _decode(frames[0])["state"] == "PENDING"
+    assert KEEPALIVE in frames[1:-1]
+    assert set(frames[1:-1]) == {KEEPALIVE}
+    last = _decode(frames[-1])
+    assert last["state"] == "ERROR" and "timed out" in last["error"]
+    assert sse._watchers == {}
+
+
+def test_stream_reports_backend_errors(fake_redis, monkeypatch):
+    class _BrokenRedis:
+        async def get(self, key):
+            raise ConnectionError("backend down")
+
+    monkeypatch.setattr(sse, "_redis", _BrokenRedis())
+
+    frames = asyncio.run(_collect("task-1"))
+
+    assert len(frames) == 1
+    event = _decode(frames[0])
+    assert event["state"] == "ERROR" and "backend down" in event["error"]
+    assert sse._watchers == {}
+
+
+def test_listener_fans_out_updates_to_streams(fake_redis):
+    async def scenario():
+        listener = asyncio.create_task(sse.run_result_listener())
+        try:
+            streams = [asyncio.create_task(_collect("task-1")) for _ in range(2)]
+            # Both streams have sent their PENDING frame and share one watcher
+            while "task-1" not in sse._watchers or sse._watchers["task-1"].meta is None:
+                await asyncio.sleep(0.01)
+            assert sse._watchers["task-1"].refcount == 2
+            await asyncio.sleep(0.05)  # let the listener subscribe
+
+            fake_redis.backend.store_result("task-1", {"best_fitness": 1.0}, "STARTED")
+            fake_redis.backend.store_result("task-1", {"best_fitness": 0.5}, "SUCCESS")
+            return await asyncio.gather(*streams)
+        finally:
+            listener.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await listener
+
+    results = asyncio.run(scenario())
+
+    for frames in results:
+        states = [_decode(frame)["state"] for frame in frames]
+        assert states[0] == "PENDING" and states[-1] == "SUCCESS"
+    assert sse._watchers == {}